@@ -2,17 +2,14 @@
 Collaborative Chat App - Backend
 
 A simple example demonstrating the collabkit framework for real-time chat.
+Install collabkit first: pip install -e ../../../python
 Run with: python main.py
 
 Uses in-memory storage for simplicity (data is not persisted).
 """
 
-import sys
 import os
 
-# Add the parent package to path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "python"))
-
 from collabkit import CollabkitServer
 from collabkit.auth import NoAuth
 from collabkit.storage import MemoryStorage
@@ -22,7 +19,7 @@ storage = MemoryStorage()
 server = CollabkitServer(auth_provider=NoAuth(), storage_backend=storage)
 
 
-@server.register_function("clear_messages")
+@server.register_function("clear_messages", debounce_ms=50)
 async def clear_messages(room, user, args):
     """
     Server-side function to clear all messages.
@@ -33,6 +30,10 @@ async def clear_messages(room, user, args):
     # Count how many were cleared
     cleared_count = len(messages)
 
+    # Nothing to clear: skip the write and the broadcast to every client
+    if not cleared_count:
+        return {"cleared": 0}
+
     # Clear all messages
     room.state.set(["messages"], [], user.id)
 
@@ -47,4 +48,15 @@ if __name__ == "__main__":
     import uvicorn
     bind_host = os.environ.get("BIND_HOST", "127.0.0.1")
     bind_port = int(os.environ.get("BIND_PORT", "8002"))
-    uvicorn.run(app, host=bind_host, port=bind_port)
+    # Rooms and presence are held in process memory, so clients only see each
+    # other when they are connected to the same worker. Keep WEB_CONCURRENCY=1
+    # unless all clients of a room are routed to the same worker.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host=bind_host,
+        port=bind_port,
+        workers=workers,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        log_level="warning",
+    )
@@ -2,16 +2,14 @@
 Combined Demo - Backend
 
 A unified backend serving all demo rooms (todos, editor, chat).
+Install collabkit first: pip install -e ../../../python
 Run with: python main.py
 
 Uses in-memory storage for simplicity (data is not persisted).
 """
 
-import sys
 import os
-
-# Add the parent package to path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "python"))
+from time import time_ns
 
 from collabkit import CollabkitServer
 from collabkit.auth import NoAuth
@@ -26,7 +24,7 @@ server = CollabkitServer(auth_provider=NoAuth(), storage_backend=storage)
 # Todo Functions
 # ============================================================================
 
-@server.register_function("clear_completed")
+@server.register_function("clear_completed", debounce_ms=50)
 async def clear_completed(room, user, args):
     """Clear all completed todos."""
     state = room.state.value()
@@ -36,6 +34,9 @@ async def clear_completed(room, user, args):
     active_todos = [t for t in todos if not t.get("done", False)]
     cleared_count = original_count - len(active_todos)
 
+    if not cleared_count:
+        return {"cleared": 0}
+
     room.state.set(["todos"], active_todos, user.id)
 
     return {"cleared": cleared_count}
@@ -47,10 +48,21 @@ async def toggle_all(room, user, args):
     state = room.state.value()
     todos = state.get("todos", [])
 
-    all_done = all(t.get("done", False) for t in todos) if todos else False
+    all_done = bool(todos)
+    for t in todos:
+        if not t.get("done", False):
+            all_done = False
+            break
     target_state = not all_done
 
-    updated_todos = [{**t, "done": target_state} for t in todos]
+    # Copy rather than mutate: the todo dicts are shared with the CRDT state.
+    # Todos already in the target state are reused as-is.
+    updated_todos = []
+    for t in todos:
+        if t.get("done", False) is not target_state:
+            t = t.copy()
+            t["done"] = target_state
+        updated_todos.append(t)
 
     room.state.set(["todos"], updated_todos, user.id)
 
@@ -61,7 +73,7 @@ async def toggle_all(room, user, args):
 # Editor Functions
 # ============================================================================
 
-@server.register_function("clear_document")
+@server.register_function("clear_document", debounce_ms=50)
 async def clear_document(room, user, args):
     """Clear the document."""
     state = room.state.value()
@@ -69,10 +81,13 @@ async def clear_document(room, user, args):
 
     previous_length = len(document.get("text", ""))
 
+    if not previous_length:
+        return {"cleared_characters": 0}
+
     room.state.set(["document"], {
         "text": "",
         "lastEditedBy": user.id,
-        "lastEditedAt": int(__import__("time").time() * 1000),
+        "lastEditedAt": time_ns() // 1_000_000,
     }, user.id)
 
     return {"cleared_characters": previous_length}
@@ -82,13 +97,17 @@ async def clear_document(room, user, args):
 # Chat Functions
 # ============================================================================
 
-@server.register_function("clear_messages")
+@server.register_function("clear_messages", debounce_ms=50)
 async def clear_messages(room, user, args):
     """Clear all messages."""
     state = room.state.value()
     messages = state.get("messages", [])
 
     cleared_count = len(messages)
+
+    if not cleared_count:
+        return {"cleared": 0}
+
     room.state.set(["messages"], [], user.id)
 
     return {"cleared": cleared_count}
@@ -102,4 +121,15 @@ if __name__ == "__main__":
     import uvicorn
     bind_host = os.environ.get("BIND_HOST", "127.0.0.1")
     bind_port = int(os.environ.get("BIND_PORT", "8010"))
-    uvicorn.run(app, host=bind_host, port=bind_port)
+    # Rooms and presence are held in process memory, so clients only see each
+    # other when they are connected to the same worker. Keep WEB_CONCURRENCY=1
+    # unless all clients of a room are routed to the same worker.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host=bind_host,
+        port=bind_port,
+        workers=workers,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        log_level="warning",
+    )
@@ -2,16 +2,14 @@
 Collaborative Text Editor - Backend
 
 A simple example demonstrating the collabkit framework.
+Install collabkit first: pip install -e ../../../python
 Run with: python main.py
 
 Uses in-memory storage for simplicity (data is not persisted).
 """
 
-import sys
 import os
-
-# Add the parent package to path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "python"))
+from time import time_ns
 
 from collabkit import CollabkitServer
 from collabkit.auth import NoAuth
@@ -22,7 +20,7 @@ storage = MemoryStorage()
 server = CollabkitServer(auth_provider=NoAuth(), storage_backend=storage)
 
 
-@server.register_function("clear_document")
+@server.register_function("clear_document", debounce_ms=50)
 async def clear_document(room, user, args):
     """
     Server-side function to clear the document.
@@ -32,11 +30,15 @@ async def clear_document(room, user, args):
 
     previous_length = len(document.get("text", ""))
 
+    # Already empty: skip the write and the broadcast to every client
+    if not previous_length:
+        return {"cleared_characters": 0}
+
     # Clear the document
     room.state.set(["document"], {
         "text": "",
         "lastEditedBy": user.id,
-        "lastEditedAt": int(__import__("time").time() * 1000),
+        "lastEditedAt": time_ns() // 1_000_000,
     }, user.id)
 
     return {"cleared_characters": previous_length}
@@ -51,12 +53,10 @@ async def get_word_count(room, user, args):
     document = state.get("document", {})
     text = document.get("text", "")
 
-    words = text.split() if text.strip() else []
-
     return {
-        "word_count": len(words),
+        "word_count": len(text.split()),
         "char_count": len(text),
-        "line_count": len(text.split("\n")) if text else 0,
+        "line_count": text.count("\n") + 1 if text else 0,
     }
 
 
@@ -68,4 +68,15 @@ if __name__ == "__main__":
     import uvicorn
     bind_host = os.environ.get("BIND_HOST", "127.0.0.1")
     bind_port = int(os.environ.get("BIND_PORT", "8001"))
-    uvicorn.run(app, host=bind_host, port=bind_port)
+    # Rooms and presence are held in process memory, so clients only see each
+    # other when they are connected to the same worker. Keep WEB_CONCURRENCY=1
+    # unless all clients of a room are routed to the same worker.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host=bind_host,
+        port=bind_port,
+        workers=workers,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        log_level="warning",
+    )
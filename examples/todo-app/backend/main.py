@@ -2,6 +2,7 @@
 Collaborative Todo App - Backend
 
 A simple example demonstrating the collabkit framework.
+Install collabkit first: pip install -e ../../../python
 Run with: uvicorn main:app --reload
 
 Environment variables:
@@ -10,9 +11,12 @@ Environment variables:
   POSTGRES_DB       - Database name (default: collabkit)
   POSTGRES_USER     - Database user (default: postgres)
   POSTGRES_PASSWORD - Database password (required)
+  POSTGRES_DSN      - Connection URI; overrides the host/port/db/user settings
+  POSTGRES_POOL_MIN - Minimum pooled connections (default: 4)
+  POSTGRES_POOL_MAX - Maximum pooled connections (default: 25)
+  WEB_CONCURRENCY   - Number of uvicorn worker processes (default: 1)
 """
 
-import sys
 import os
 
 # Load environment variables from .env file if present
@@ -22,26 +26,33 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, rely on system environment variables
 
-# Add the parent package to path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "python"))
-
 from collabkit import CollabkitServer
 from collabkit.auth import NoAuth
 from collabkit.storage import PostgresStorage
 
+# Rooms and presence are held in process memory, so clients only see each other
+# when they are connected to the same worker. Keep WEB_CONCURRENCY=1 unless all
+# clients of a room are routed to the same worker.
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
 # Create server with PostgreSQL storage
-# Tables are created automatically on first connect
+# Tables are created automatically on first connect. The storage owns a single
+# asyncpg pool, opened at app startup and shared by every room and call.
 storage = PostgresStorage(
     host=os.environ.get("POSTGRES_HOST", "localhost"),
     port=int(os.environ.get("POSTGRES_PORT", "5432")),
     database=os.environ.get("POSTGRES_DB", "collabkit"),
     user=os.environ.get("POSTGRES_USER", "postgres"),
     password=os.environ.get("POSTGRES_PASSWORD", ""),
+    # Each worker opens its own pool; split the connection budget between them
+    min_size=max(1, int(os.environ.get("POSTGRES_POOL_MIN", "4")) // WORKERS),
+    max_size=max(1, int(os.environ.get("POSTGRES_POOL_MAX", "25")) // WORKERS),
+    dsn=os.environ.get("POSTGRES_DSN") or None,
 )
 server = CollabkitServer(auth_provider=NoAuth(), storage_backend=storage)
 
 
-@server.register_function("clear_completed")
+@server.register_function("clear_completed", debounce_ms=50)
 async def clear_completed(room, user, args):
     """
     Server-side function to clear all completed todos.
@@ -55,6 +66,10 @@ async def clear_completed(room, user, args):
     active_todos = [t for t in todos if not t.get("done", False)]
     cleared_count = original_count - len(active_todos)
 
+    # Nothing to clear: skip the write and the broadcast to every client
+    if not cleared_count:
+        return {"cleared": 0}
+
     # Update the state
     room.state.set(["todos"], active_todos, user.id)
 
@@ -70,13 +85,21 @@ async def toggle_all(room, user, args):
     todos = state.get("todos", [])
 
     # If all are done, mark all as not done; otherwise mark all as done
-    all_done = all(t.get("done", False) for t in todos) if todos else False
+    all_done = bool(todos)
+    for t in todos:
+        if not t.get("done", False):
+            all_done = False
+            break
     target_state = not all_done
 
-    updated_todos = [
-        {**t, "done": target_state}
-        for t in todos
-    ]
+    # Copy rather than mutate: the todo dicts are shared with the CRDT state.
+    # Todos already in the target state are reused as-is.
+    updated_todos = []
+    for t in todos:
+        if t.get("done", False) is not target_state:
+            t = t.copy()
+            t["done"] = target_state
+        updated_todos.append(t)
 
     room.state.set(["todos"], updated_todos, user.id)
 
@@ -92,4 +115,11 @@ if __name__ == "__main__":
     # SECURITY: Bind to localhost by default. Set BIND_HOST=0.0.0.0 for network access.
     bind_host = os.environ.get("BIND_HOST", "127.0.0.1")
     bind_port = int(os.environ.get("BIND_PORT", "8000"))
-    uvicorn.run(app, host=bind_host, port=bind_port)
+    uvicorn.run(
+        "main:app" if WORKERS > 1 else app,
+        host=bind_host,
+        port=bind_port,
+        workers=WORKERS,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        log_level="warning",
+    )
@@ -606,81 +606,92 @@ export class CollabkitClient {
     }
 
     try {
-      const parsed = JSON.parse(data);
+      const parsed: unknown = JSON.parse(data);
 
-      // Validate message structure
-      if (!isValidServerMessage(parsed)) {
-        console.error("[CollabkitClient] Invalid message structure, ignoring");
-        return;
-      }
-
-      const message = parsed;
-
-      switch (message.type) {
-        case "authenticated":
-          this.userId = (message.user_id ?? message.userId) as string;
-          break;
-
-        case "joined":
-          this.handleJoined(message);
-          break;
-
-        case "presence":
-          this.handlePresenceUpdate(message);
-          break;
-
-        case "user_joined":
-          this.handleUserJoined(message);
-          break;
-
-        case "user_left":
-          this.handleUserLeft(message);
-          break;
-
-        case "call_result":
-          this.handleFunctionResult(message);
-          break;
-
-        case "operation":
-          this.handleOperation(message);
-          break;
-
-        case "sync":
-          this.handleSync(message);
-          break;
-
-        case "error":
-          console.error("[CollabkitClient] Server error:", message.code, message.message);
-          break;
-
-        // Screen share / WebRTC signaling
-        case "screenshare_started":
-          this.handleScreenShareStarted(message);
-          break;
-        case "screenshare_stopped":
-          this.handleScreenShareStopped(message);
-          break;
-        case "rtc_offer":
-          this.handleRtcOffer(message);
-          break;
-        case "rtc_answer":
-          this.handleRtcAnswer(message);
-          break;
-        case "rtc_ice_candidate":
-          this.handleRtcIceCandidate(message);
-          break;
-        case "remote_control_request":
-          this.handleRemoteControlRequest(message);
-          break;
-        case "remote_control_response":
-          this.handleRemoteControlResponse(message);
-          break;
+      // Rooms that coalesce sends deliver several messages as one JSON array
+      if (Array.isArray(parsed)) {
+        for (const item of parsed) {
+          this.dispatchMessage(item);
+        }
+      } else {
+        this.dispatchMessage(parsed);
       }
     } catch {
       console.error("Failed to parse message:", data);
     }
   }
 
+  private dispatchMessage(parsed: unknown): void {
+    // Validate message structure
+    if (!isValidServerMessage(parsed)) {
+      console.error("[CollabkitClient] Invalid message structure, ignoring");
+      return;
+    }
+
+    const message = parsed;
+
+    switch (message.type) {
+      case "authenticated":
+        this.userId = (message.user_id ?? message.userId) as string;
+        break;
+
+      case "joined":
+        this.handleJoined(message);
+        break;
+
+      case "presence":
+        this.handlePresenceUpdate(message);
+        break;
+
+      case "user_joined":
+        this.handleUserJoined(message);
+        break;
+
+      case "user_left":
+        this.handleUserLeft(message);
+        break;
+
+      case "call_result":
+        this.handleFunctionResult(message);
+        break;
+
+      case "operation":
+        this.handleOperation(message);
+        break;
+
+      case "sync":
+        this.handleSync(message);
+        break;
+
+      case "error":
+        console.error("[CollabkitClient] Server error:", message.code, message.message);
+        break;
+
+      // Screen share / WebRTC signaling
+      case "screenshare_started":
+        this.handleScreenShareStarted(message);
+        break;
+      case "screenshare_stopped":
+        this.handleScreenShareStopped(message);
+        break;
+      case "rtc_offer":
+        this.handleRtcOffer(message);
+        break;
+      case "rtc_answer":
+        this.handleRtcAnswer(message);
+        break;
+      case "rtc_ice_candidate":
+        this.handleRtcIceCandidate(message);
+        break;
+      case "remote_control_request":
+        this.handleRemoteControlRequest(message);
+        break;
+      case "remote_control_response":
+        this.handleRemoteControlResponse(message);
+        break;
+    }
+  }
+
   /**
    * Handle incoming CRDT operation from server.
    */
@@ -2,58 +2,137 @@
 CollabKit - A collaborative toolkit for real-time applications.
 """
 
-from collabkit.crdt import CRDT, LWWMap, LWWRegister, ORSet, GCounter, PNCounter
-from collabkit.auth import AuthProvider, AuthToken, AuthUser
-from collabkit.permissions import Permission, PermissionManager, Role
-from collabkit.storage import StorageBackend, PostgresStorage, MemoryStorage
+from __future__ import annotations
 
-# Protocol message types
-from collabkit.protocol import (
-    User,
-    # Client messages
-    JoinMessage,
-    LeaveMessage,
-    OperationMessage,
-    SyncRequestMessage,
-    CallMessage,
-    PresenceMessage,
-    PingMessage,
-    ClientMessage,
-    # Server messages
-    JoinedMessage,
-    OperationBroadcast,
-    SyncMessage,
-    CallResultMessage,
-    PresenceBroadcast,
-    UserJoinedMessage,
-    UserLeftMessage,
-    ErrorMessage,
-    PongMessage,
-    ServerMessage,
-    ErrorCode,
-    parse_client_message,
-    parse_server_message,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Presence tracking
-from collabkit.presence import (
-    PresenceData,
-    RoomPresence,
-    PresenceManager,
-)
+if TYPE_CHECKING:
+    from collabkit.crdt import CRDT, LWWMap, LWWRegister, ORSet, GCounter, PNCounter
+    from collabkit.auth import AuthProvider, AuthToken, AuthUser
+    from collabkit.permissions import Permission, PermissionManager, Role
+    from collabkit.storage import StorageBackend, PostgresStorage, MemoryStorage
 
-# Room management
-from collabkit.room import (
-    Room,
-    RoomManager,
-    RegisteredFunction,
-)
+    # Protocol message types
+    from collabkit.protocol import (
+        User,
+        # Client messages
+        JoinMessage,
+        LeaveMessage,
+        OperationMessage,
+        SyncRequestMessage,
+        CallMessage,
+        PresenceMessage,
+        PingMessage,
+        ClientMessage,
+        # Server messages
+        JoinedMessage,
+        OperationBroadcast,
+        SyncMessage,
+        CallResultMessage,
+        PresenceBroadcast,
+        UserJoinedMessage,
+        UserLeftMessage,
+        ErrorMessage,
+        PongMessage,
+        ServerMessage,
+        ErrorCode,
+        parse_client_message,
+        parse_server_message,
+    )
 
-# Server
-from collabkit.server import CollabkitServer
+    # Presence tracking
+    from collabkit.presence import (
+        PresenceData,
+        RoomPresence,
+        PresenceManager,
+    )
+
+    # Room management
+    from collabkit.room import (
+        Room,
+        RoomManager,
+        RegisteredFunction,
+    )
+
+    # Server
+    from collabkit.server import CollabkitServer
 
 __version__ = "0.1.0"
 
+# Public name -> defining submodule. Resolved on first attribute access
+# (PEP 562) so that ``import collabkit`` does not pull in pydantic models,
+# asyncpg, or FastAPI until they are actually used.
+_LAZY_IMPORTS: dict[str, str] = {
+    # CRDT types
+    "CRDT": "collabkit.crdt",
+    "LWWMap": "collabkit.crdt",
+    "LWWRegister": "collabkit.crdt",
+    "ORSet": "collabkit.crdt",
+    "GCounter": "collabkit.crdt",
+    "PNCounter": "collabkit.crdt",
+    # Auth classes
+    "AuthProvider": "collabkit.auth",
+    "AuthToken": "collabkit.auth",
+    "AuthUser": "collabkit.auth",
+    # Permission classes
+    "Permission": "collabkit.permissions",
+    "PermissionManager": "collabkit.permissions",
+    "Role": "collabkit.permissions",
+    # Storage classes
+    "StorageBackend": "collabkit.storage",
+    "PostgresStorage": "collabkit.storage",
+    "MemoryStorage": "collabkit.storage",
+    # Protocol
+    "User": "collabkit.protocol",
+    "JoinMessage": "collabkit.protocol",
+    "LeaveMessage": "collabkit.protocol",
+    "OperationMessage": "collabkit.protocol",
+    "SyncRequestMessage": "collabkit.protocol",
+    "CallMessage": "collabkit.protocol",
+    "PresenceMessage": "collabkit.protocol",
+    "PingMessage": "collabkit.protocol",
+    "ClientMessage": "collabkit.protocol",
+    "JoinedMessage": "collabkit.protocol",
+    "OperationBroadcast": "collabkit.protocol",
+    "SyncMessage": "collabkit.protocol",
+    "CallResultMessage": "collabkit.protocol",
+    "PresenceBroadcast": "collabkit.protocol",
+    "UserJoinedMessage": "collabkit.protocol",
+    "UserLeftMessage": "collabkit.protocol",
+    "ErrorMessage": "collabkit.protocol",
+    "PongMessage": "collabkit.protocol",
+    "ServerMessage": "collabkit.protocol",
+    "ErrorCode": "collabkit.protocol",
+    "parse_client_message": "collabkit.protocol",
+    "parse_server_message": "collabkit.protocol",
+    # Presence
+    "PresenceData": "collabkit.presence",
+    "RoomPresence": "collabkit.presence",
+    "PresenceManager": "collabkit.presence",
+    # Room
+    "Room": "collabkit.room",
+    "RoomManager": "collabkit.room",
+    "RegisteredFunction": "collabkit.room",
+    # Server
+    "CollabkitServer": "collabkit.server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # CRDT types
     "CRDT",
@@ -0,0 +1,15 @@
+"""
+Python version compatibility helpers.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# ``@dataclass(slots=True)`` needs Python 3.10+; on 3.9 fall back to a regular
+# dataclass. Use as ``@dataclass(**DATACLASS_SLOTS)``.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+__all__ = [
+    "DATACLASS_SLOTS",
+]
@@ -6,15 +6,18 @@ Provides authentication primitives for securing collaborative sessions.
 
 from __future__ import annotations
 
+import secrets
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
-import uuid
 
+from .._compat import DATACLASS_SLOTS
+from .base import _display_name
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AuthUser:
     """Represents an authenticated user."""
 
@@ -28,7 +31,7 @@ class AuthUser:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AuthToken:
     """Represents an authentication token."""
 
@@ -74,6 +77,10 @@ class AuthProvider(ABC):
         pass
 
 
+# Lifetime of tokens issued by NoAuth
+_NOAUTH_TOKEN_TTL = timedelta(days=365)
+
+
 class NoAuth(AuthProvider):
     """No authentication provider for demos and development ONLY.
 
@@ -97,23 +104,30 @@ class NoAuth(AuthProvider):
             )
             NoAuth._warned = True
 
-    async def authenticate(self, credentials: Dict[str, Any]) -> Optional[AuthToken]:
-        """Create a token for any credentials."""
-        user_id = credentials.get("user_id", str(uuid.uuid4()))
+    @staticmethod
+    def _issue_token(user_id: str) -> AuthToken:
+        """Issue an all-scopes token for a user."""
         return AuthToken(
-            token=str(uuid.uuid4()),
+            token=secrets.token_hex(16),
             user_id=user_id,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=365),
+            expires_at=datetime.now(timezone.utc) + _NOAUTH_TOKEN_TTL,
             scopes=["*"],
         )
 
+    async def authenticate(self, credentials: Dict[str, Any]) -> Optional[AuthToken]:
+        """Create a token for any credentials."""
+        user_id = credentials.get("user_id")
+        if user_id is None:
+            user_id = secrets.token_hex(16)
+        return self._issue_token(user_id)
+
     async def validate_token(self, token: str) -> Optional[AuthUser]:
         """Accept any token and return a user derived from it."""
         if not token:
             return None
         return AuthUser(
             id=token,
-            name=f"User {token[:8]}",
+            name=_display_name(token),
             email=None,
             metadata={},
         )
@@ -124,12 +138,7 @@ class NoAuth(AuthProvider):
 
     async def refresh_token(self, token: str) -> Optional[AuthToken]:
         """Generate a new token."""
-        return AuthToken(
-            token=str(uuid.uuid4()),
-            user_id=str(uuid.uuid4()),
-            expires_at=datetime.now(timezone.utc) + timedelta(days=365),
-            scopes=["*"],
-        )
+        return self._issue_token(secrets.token_hex(16))
 
 
 __all__ = [
@@ -7,13 +7,26 @@ Implement this interface to integrate your own authentication system.
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _display_name(token: str) -> str:
+    """Display name for a NoAuth user; cached since clients reconnect with the same token."""
+    return f"User {token[:8]}"
+
+
+def _intern_roles(roles: list[Any]) -> list[Any]:
+    """Intern role names; they repeat across every user and permission check."""
+    return [sys.intern(role) if type(role) is str else role for role in roles]
+
+
 @dataclass
 class AuthUser:
     """
@@ -53,7 +66,7 @@ class AuthUser:
             id=data["id"],
             name=data["name"],
             email=data.get("email"),
-            roles=data.get("roles", []),
+            roles=_intern_roles(data.get("roles", [])),
             metadata=data.get("metadata", {}),
         )
 
@@ -153,6 +166,6 @@ class NoAuth(AuthProvider):
             return None
         return AuthUser(
             id=token,
-            name=f"User {token[:8]}",
+            name=_display_name(token),
             roles=[],  # No default roles - require explicit permission grants
         )
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any
 import time
 
-from .base import AuthProvider, AuthUser
+from .base import AuthProvider, AuthUser, _intern_roles
 
 
 class JWTAuthProvider(AuthProvider):
@@ -92,7 +92,7 @@ class JWTAuthProvider(AuthProvider):
                 id=payload["sub"],
                 name=payload.get("name", f"User {payload['sub'][:8]}"),
                 email=payload.get("email"),
-                roles=payload.get("roles", []),
+                roles=_intern_roles(payload.get("roles", [])),
                 metadata=payload.get("metadata", {}),
             )
 
@@ -8,15 +8,20 @@ to shared state without coordination, automatically merging changes.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Generic, TypeVar
+from types import MappingProxyType
+from typing import Any, Generic, Iterable, Iterator, Mapping, Sequence, TypeVar
+import secrets
+import sys
 import time
-import uuid
+
+from .._compat import DATACLASS_SLOTS
 
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Operation:
     """
     Represents a single operation on a CRDT.
@@ -41,7 +46,7 @@ class Operation:
     ) -> "Operation":
         """Create a new operation with auto-generated ID and timestamp."""
         return cls(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(16),
             timestamp=time.time(),
             node_id=node_id,
             path=tuple(path) if isinstance(path, list) else path,
@@ -60,6 +65,34 @@ class Operation:
             "value": self.value,
         }
 
+    def to_tuple(self) -> tuple[str, float, str, tuple[str, ...], str, Any]:
+        """
+        Serialize operation to a compact (id, timestamp, node_id, path,
+        op_type, value) tuple.
+
+        Used for internal snapshots; use to_dict() for client-facing JSON.
+        """
+        return (self.id, self.timestamp, self.node_id, self.path, self.op_type, self.value)
+
+    @classmethod
+    def from_tuple(cls, data: Sequence[Any]) -> "Operation":
+        """
+        Deserialize operation from a to_tuple() record.
+
+        The path may be any sequence (JSON turns tuples into lists). The
+        timestamp is kept as-is, since these records come from the server's
+        own snapshots rather than from clients.
+        """
+        op_id, timestamp, node_id, path, op_type, value = data
+        return cls(
+            id=op_id,
+            timestamp=timestamp,
+            node_id=sys.intern(node_id),
+            path=tuple(path),
+            op_type=sys.intern(op_type),
+            value=value,
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, Any], use_server_timestamp: bool = True) -> "Operation":
         """
@@ -73,14 +106,16 @@ class Operation:
         return cls(
             id=data["id"],
             timestamp=time.time() if use_server_timestamp else data["timestamp"],
-            node_id=data["node_id"],
+            # Interned so the many ops from one peer share a single key object
+            # in counts and version vectors, and op_type compares by identity
+            node_id=sys.intern(data["node_id"]),
             path=tuple(data["path"]),
-            op_type=data["op_type"],
+            op_type=sys.intern(data["op_type"]),
             value=data.get("value"),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VersionVector:
     """
     Tracks the latest timestamp seen from each node.
@@ -92,8 +127,9 @@ class VersionVector:
 
     def update(self, node_id: str, timestamp: float) -> None:
         """Update the vector with a new timestamp from a node."""
-        current = self.timestamps.get(node_id, 0)
-        self.timestamps[node_id] = max(current, timestamp)
+        timestamps = self.timestamps
+        if timestamp > timestamps.get(node_id, 0):
+            timestamps[node_id] = timestamp
 
     def get(self, node_id: str) -> float:
         """Get the latest timestamp seen from a node."""
@@ -101,8 +137,14 @@ class VersionVector:
 
     def merge(self, other: "VersionVector") -> None:
         """Merge another version vector into this one."""
+        timestamps = self.timestamps
         for node_id, timestamp in other.timestamps.items():
-            self.update(node_id, timestamp)
+            if timestamp > timestamps.get(node_id, 0):
+                timestamps[node_id] = timestamp
+
+    def view(self) -> Mapping[str, float]:
+        """Read-only live view of the timestamps, without copying them."""
+        return MappingProxyType(self.timestamps)
 
     def to_dict(self) -> dict[str, float]:
         """Serialize to dictionary."""
@@ -127,7 +169,11 @@ class CRDT(ABC, Generic[T]):
 
     def __init__(self, node_id: str):
         self.node_id = node_id
+        # Operations ordered by timestamp, with their timestamps mirrored in
+        # _timestamps so operations_since can bisect instead of scanning
         self._operations: list[Operation] = []
+        self._timestamps: list[float] = []
+        self._op_ids: set[str] = set()
         self._version_vector = VersionVector()
 
     @abstractmethod
@@ -151,7 +197,7 @@ class CRDT(ABC, Generic[T]):
 
     def operations_since(self, timestamp: float) -> list[Operation]:
         """Get all operations after the given timestamp."""
-        return [op for op in self._operations if op.timestamp > timestamp]
+        return self._operations[bisect_right(self._timestamps, timestamp):]
 
     def all_operations(self) -> list[Operation]:
         """Get all operations."""
@@ -159,12 +205,46 @@ class CRDT(ABC, Generic[T]):
 
     def _record_operation(self, op: Operation) -> None:
         """Record an operation and update version vector."""
-        self._operations.append(op)
+        timestamps = self._timestamps
+        if not timestamps or op.timestamp >= timestamps[-1]:
+            self._operations.append(op)
+            timestamps.append(op.timestamp)
+        else:
+            # Out-of-order arrival (e.g. merged from a peer); keep both lists sorted
+            index = bisect_right(timestamps, op.timestamp)
+            self._operations.insert(index, op)
+            timestamps.insert(index, op.timestamp)
+        self._op_ids.add(op.id)
         self._version_vector.update(op.node_id, op.timestamp)
 
+    def _load_operations(self, records: Iterable[Any]) -> None:
+        """
+        Replace the operation log, e.g. when reconstructing from state.
+
+        Accepts to_tuple() records as well as the older to_dict() form.
+        """
+        operations = [
+            Operation.from_dict(record)
+            if isinstance(record, dict)
+            else Operation.from_tuple(record)
+            for record in records
+        ]
+        operations.sort(key=lambda op: op.timestamp)
+        self._operations = operations
+        self._timestamps = [op.timestamp for op in operations]
+        self._op_ids = {op.id for op in operations}
+
+    def _merge_operations(self, other: "CRDT[T]") -> None:
+        """Record the operations from another replica that we haven't seen."""
+        new_ids = other._op_ids - self._op_ids
+        if new_ids:
+            for op in other._operations:
+                if op.id in new_ids:
+                    self._record_operation(op)
+
     def _has_seen(self, op: Operation) -> bool:
         """Check if we've already seen this operation."""
-        return any(existing.id == op.id for existing in self._operations)
+        return op.id in self._op_ids
 
 
 class StateCRDT(CRDT[T]):
@@ -176,8 +256,13 @@ class StateCRDT(CRDT[T]):
     """
 
     @abstractmethod
-    def state(self) -> dict[str, Any]:
-        """Get the full CRDT state for transmission."""
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full CRDT state for transmission.
+
+        Args:
+            include_ops: Also include the operation log
+        """
         ...
 
     @classmethod
@@ -185,3 +270,23 @@ class StateCRDT(CRDT[T]):
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "StateCRDT[T]":
         """Reconstruct CRDT from transmitted state."""
         ...
+
+    def state_stream(self, include_ops: bool = False) -> Iterator[tuple[str, Any]]:
+        """
+        Yield the state as ``(kind, item)`` pairs instead of one dict.
+
+        Lets a transport serialize large replicas incrementally. Operations
+        are yielded one at a time as ``("op", op.to_tuple())``. Consume the
+        stream before applying further operations.
+
+        Args:
+            include_ops: Also yield the operation log
+        """
+        yield from self.state().items()
+        if include_ops:
+            yield from self._stream_operations()
+
+    def _stream_operations(self) -> Iterator[tuple[str, Any]]:
+        """Yield the operation log as ``("op", record)`` pairs."""
+        for op in self._operations:
+            yield "op", op.to_tuple()
@@ -7,11 +7,23 @@ PN-Counter: Positive-Negative counter (increment and decrement)
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
 
 from .base import Operation, StateCRDT
 
 
+def _merge_max(counts: dict[str, int], other: dict[str, int]) -> int:
+    """Take the per-node max of ``other`` into ``counts``; return how much it grew."""
+    get = counts.get
+    grown = 0
+    for node_id, count in other.items():
+        current = get(node_id, 0)
+        if count > current:
+            counts[node_id] = count
+            grown += count - current
+    return grown
+
+
 class GCounter(StateCRDT[int]):
     """
     Grow-only Counter (G-Counter).
@@ -28,6 +40,8 @@ class GCounter(StateCRDT[int]):
     def __init__(self, node_id: str):
         super().__init__(node_id)
         self._counts: dict[str, int] = {}
+        # Running sum of _counts so value() is O(1)
+        self._total = 0
 
     def increment(self, amount: int = 1) -> Operation:
         """
@@ -64,40 +78,57 @@ class GCounter(StateCRDT[int]):
         # Add to the node's count
         current = self._counts.get(op.node_id, 0)
         self._counts[op.node_id] = current + op.value
+        self._total += op.value
 
         self._record_operation(op)
         return True
 
     def merge(self, other: "GCounter") -> None:
         """Merge another counter by taking max of each node's count."""
-        for node_id, count in other._counts.items():
-            current = self._counts.get(node_id, 0)
-            self._counts[node_id] = max(current, count)
+        self.merge_state_only(other)
+
+        # Also record any operations we haven't seen
+        self._merge_operations(other)
+
+    def merge_state_only(self, other: "GCounter") -> None:
+        """
+        Merge another counter's counts without copying its operation log.
 
-        # Also apply any operations we haven't seen
-        for op in other.all_operations():
-            if not self._has_seen(op):
-                self._record_operation(op)
+        The per-node maxima fully determine the value, so this is enough
+        for replicas that only sync state and don't serve operation history.
+        """
+        self._total += _merge_max(self._counts, other._counts)
 
     def value(self) -> int:
         """Get the current counter value (sum of all node counts)."""
-        return sum(self._counts.values())
+        return self._total
+
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full state for transmission.
 
-    def state(self) -> dict[str, Any]:
-        """Get the full state for transmission."""
-        return {
+        The operation log is only included when ``include_ops`` is true.
+        """
+        state: dict[str, Any] = {
             "counts": dict(self._counts),
-            "operations": [op.to_dict() for op in self._operations],
         }
+        if include_ops:
+            state["operations"] = [op.to_tuple() for op in self._operations]
+        return state
+
+    def state_stream(self, include_ops: bool = False) -> Iterator[tuple[str, Any]]:
+        """Yield ``("counts", ...)``, then the operations if requested."""
+        yield "counts", dict(self._counts)
+        if include_ops:
+            yield from self._stream_operations()
 
     @classmethod
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "GCounter":
         """Reconstruct counter from transmitted state."""
         counter = cls(node_id)
         counter._counts = dict(state.get("counts", {}))
-        counter._operations = [
-            Operation.from_dict(op) for op in state.get("operations", [])
-        ]
+        counter._total = sum(counter._counts.values())
+        counter._load_operations(state.get("operations", ()))
         return counter
 
 
@@ -119,6 +150,8 @@ class PNCounter(StateCRDT[int]):
         super().__init__(node_id)
         self._positive: dict[str, int] = {}  # Increment counts per node
         self._negative: dict[str, int] = {}  # Decrement counts per node
+        # Running positive - negative so value() is O(1)
+        self._total = 0
 
     def increment(self, amount: int = 1) -> Operation:
         """
@@ -166,9 +199,11 @@ class PNCounter(StateCRDT[int]):
         if op.op_type == "increment":
             current = self._positive.get(op.node_id, 0)
             self._positive[op.node_id] = current + op.value
+            self._total += op.value
         elif op.op_type == "decrement":
             current = self._negative.get(op.node_id, 0)
             self._negative[op.node_id] = current + op.value
+            self._total -= op.value
         else:
             raise ValueError(
                 f"PNCounter supports 'increment' and 'decrement' operations, got '{op.op_type}'"
@@ -179,31 +214,43 @@ class PNCounter(StateCRDT[int]):
 
     def merge(self, other: "PNCounter") -> None:
         """Merge another counter by taking max of each node's counts."""
-        for node_id, count in other._positive.items():
-            current = self._positive.get(node_id, 0)
-            self._positive[node_id] = max(current, count)
+        self.merge_state_only(other)
+        self._merge_operations(other)
 
-        for node_id, count in other._negative.items():
-            current = self._negative.get(node_id, 0)
-            self._negative[node_id] = max(current, count)
+    def merge_state_only(self, other: "PNCounter") -> None:
+        """
+        Merge another counter's counts without copying its operation log.
 
-        for op in other.all_operations():
-            if not self._has_seen(op):
-                self._record_operation(op)
+        The per-node maxima fully determine the value, so this is enough
+        for replicas that only sync state and don't serve operation history.
+        """
+        self._total += _merge_max(self._positive, other._positive)
+        self._total -= _merge_max(self._negative, other._negative)
 
     def value(self) -> int:
         """Get the current counter value (positive - negative)."""
-        pos = sum(self._positive.values())
-        neg = sum(self._negative.values())
-        return pos - neg
+        return self._total
 
-    def state(self) -> dict[str, Any]:
-        """Get the full state for transmission."""
-        return {
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full state for transmission.
+
+        The operation log is only included when ``include_ops`` is true.
+        """
+        state: dict[str, Any] = {
             "positive": dict(self._positive),
             "negative": dict(self._negative),
-            "operations": [op.to_dict() for op in self._operations],
         }
+        if include_ops:
+            state["operations"] = [op.to_tuple() for op in self._operations]
+        return state
+
+    def state_stream(self, include_ops: bool = False) -> Iterator[tuple[str, Any]]:
+        """Yield the positive and negative counts, then the operations if requested."""
+        yield "positive", dict(self._positive)
+        yield "negative", dict(self._negative)
+        if include_ops:
+            yield from self._stream_operations()
 
     @classmethod
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "PNCounter":
@@ -211,7 +258,6 @@ class PNCounter(StateCRDT[int]):
         counter = cls(node_id)
         counter._positive = dict(state.get("positive", {}))
         counter._negative = dict(state.get("negative", {}))
-        counter._operations = [
-            Operation.from_dict(op) for op in state.get("operations", [])
-        ]
+        counter._total = sum(counter._positive.values()) - sum(counter._negative.values())
+        counter._load_operations(state.get("operations", ()))
         return counter
@@ -7,7 +7,7 @@ Supports nested paths for deep object structures.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from .base import CRDT, Operation, StateCRDT, VersionVector
 
@@ -32,6 +32,10 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
         self._entries: dict[tuple[str, ...], tuple[Any, float, str]] = {}
         # Track deleted paths
         self._tombstones: dict[tuple[str, ...], tuple[float, str]] = {}
+        # Resolved value(), rebuilt lazily after the next change
+        self._value_cache: dict[str, Any] | None = None
+        # Ancestor path -> entry paths beneath it, in insertion order
+        self._children: dict[tuple[str, ...], dict[tuple[str, ...], None]] = {}
 
         if initial_value:
             self._init_from_value(initial_value)
@@ -43,8 +47,20 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
             if isinstance(val, dict):
                 self._init_from_value(val, current_path)
             else:
+                if current_path not in self._entries:
+                    self._index_path(current_path)
                 self._entries[current_path] = (val, 0.0, self.node_id)
 
+    def _index_path(self, path: tuple[str, ...]) -> None:
+        """Register a new entry path under each of its ancestors."""
+        children = self._children
+        for i in range(len(path)):
+            prefix = path[:i]
+            siblings = children.get(prefix)
+            if siblings is None:
+                siblings = children[prefix] = {}
+            siblings[path] = None
+
     def set(self, path: list[str] | tuple[str, ...], value: Any) -> Operation:
         """
         Set a value at the given path.
@@ -98,22 +114,23 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
         """Get all values nested under a path as a dictionary."""
         result: dict[str, Any] = {}
         path_len = len(path)
+        entries = self._entries
 
-        for entry_path, (value, ts, _) in self._entries.items():
-            if len(entry_path) > path_len and entry_path[:path_len] == path:
-                # Check tombstone
-                tombstone = self._tombstones.get(entry_path)
-                if tombstone and tombstone[0] > ts:
-                    continue
-
-                # Build nested structure
-                remaining = entry_path[path_len:]
-                current = result
-                for key in remaining[:-1]:
-                    if key not in current:
-                        current[key] = {}
-                    current = current[key]
-                current[remaining[-1]] = value
+        for entry_path in self._children.get(path, ()):
+            value, ts, _ = entries[entry_path]
+            # Check tombstone
+            tombstone = self._tombstones.get(entry_path)
+            if tombstone and tombstone[0] > ts:
+                continue
+
+            # Build nested structure
+            remaining = entry_path[path_len:]
+            current = result
+            for key in remaining[:-1]:
+                if key not in current:
+                    current[key] = {}
+                current = current[key]
+            current[remaining[-1]] = value
 
         return result if result else None
 
@@ -131,6 +148,7 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
         else:
             raise ValueError(f"LWWMap supports 'set' and 'delete' operations, got '{op.op_type}'")
 
+        self._value_cache = None
         self._record_operation(op)
         return True
 
@@ -141,6 +159,8 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
             self._flatten_set(path, value, timestamp, node_id)
         else:
             existing = self._entries.get(path)
+            if existing is None:
+                self._index_path(path)
             if existing is None or self._is_newer(timestamp, node_id, existing[1], existing[2]):
                 self._entries[path] = (value, timestamp, node_id)
 
@@ -154,6 +174,8 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
                 self._flatten_set(current_path, val, timestamp, node_id)
             else:
                 existing = self._entries.get(current_path)
+                if existing is None:
+                    self._index_path(current_path)
                 if existing is None or self._is_newer(timestamp, node_id, existing[1], existing[2]):
                     self._entries[current_path] = (val, timestamp, node_id)
 
@@ -172,12 +194,85 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
         return node1 > node2
 
     def merge(self, other: "LWWMap") -> None:
-        """Merge another map into this one."""
-        for op in other.all_operations():
-            self.apply(op)
+        """
+        Merge another map into this one.
+
+        Only the newest unseen scalar set per path is written. Dict-valued
+        sets are still flattened one by one since each can touch keys the
+        others don't. Writes happen in the order each path was first seen,
+        so entries are created in the same order as applying op by op.
+
+        The other map's entries and tombstones are then joined by LWW as
+        well, so replicas rebuilt from a state() without the operation log
+        still merge. Entries from an initial value (timestamp 0) are not
+        writes and are skipped, as when replaying operations.
+        """
+        new_ids = other._op_ids - self._op_ids
+        if new_ids:
+            self._merge_new_operations(other, new_ids)
+
+        for path, (value, timestamp, node_id) in other._entries.items():
+            if timestamp > 0.0:
+                self._apply_set(path, value, timestamp, node_id)
+        for path, (timestamp, node_id) in other._tombstones.items():
+            self._apply_delete(path, timestamp, node_id)
+        self._value_cache = None
+
+    def _merge_new_operations(self, other: "LWWMap", new_ids: set[str]) -> None:
+        """Apply and record the other map's operations listed in ``new_ids``."""
+        is_newer = self._is_newer
+        # Pending writes in order: a path (resolved to its winning scalar set)
+        # or a dict-valued set operation
+        pending: list[tuple[str, ...] | Operation] = []
+        sets: dict[tuple[str, ...], Operation] = {}
+        deletes: dict[tuple[str, ...], Operation] = {}
+        new_ops = [op for op in other._operations if op.id in new_ids]
+        # Validate and bucket everything before recording or writing, so a
+        # bad operation can't leave earlier ones marked seen but unapplied
+        for op in new_ops:
+            path = op.path
+            if op.op_type == "set":
+                if isinstance(op.value, dict):
+                    pending.append(op)
+                else:
+                    best = sets.get(path)
+                    if best is None:
+                        sets[path] = op
+                        pending.append(path)
+                    elif is_newer(op.timestamp, op.node_id, best.timestamp, best.node_id):
+                        sets[path] = op
+            elif op.op_type == "delete":
+                best = deletes.get(path)
+                if best is None or is_newer(op.timestamp, op.node_id, best.timestamp, best.node_id):
+                    deletes[path] = op
+            else:
+                raise ValueError(
+                    f"LWWMap supports 'set' and 'delete' operations, got '{op.op_type}'"
+                )
+
+        for item in pending:
+            if isinstance(item, Operation):
+                self._flatten_set(item.path, item.value, item.timestamp, item.node_id)
+            else:
+                op = sets[item]
+                self._apply_set(item, op.value, op.timestamp, op.node_id)
+        for path, op in deletes.items():
+            self._apply_delete(path, op.timestamp, op.node_id)
+        self._value_cache = None
+
+        for op in new_ops:
+            self._record_operation(op)
 
     def value(self) -> dict[str, Any]:
-        """Get the current value as a nested dictionary."""
+        """
+        Get the current value as a nested dictionary.
+
+        The result is cached until the next applied operation and shared
+        between callers, so treat it as read-only.
+        """
+        if self._value_cache is not None:
+            return self._value_cache
+
         result: dict[str, Any] = {}
 
         for path, (value, ts, _) in self._entries.items():
@@ -189,56 +284,88 @@ class LWWMap(StateCRDT[Dict[str, Any]]):
             # Build nested structure
             current = result
             for key in path[:-1]:
-                if key not in current:
-                    current[key] = {}
-                elif not isinstance(current[key], dict):
-                    # Conflict: path has both a value and nested values
-                    # Nested values take precedence
-                    current[key] = {}
-                current = current[key]
+                child = current.get(key)
+                if not isinstance(child, dict):
+                    # Missing, or a conflict where the path has both a value
+                    # and nested values: nested values take precedence
+                    child = current[key] = {}
+                current = child
 
             if path:  # Don't set if path is empty
                 current[path[-1]] = value
 
+        self._value_cache = result
         return result
 
-    def state(self) -> dict[str, Any]:
-        """Get the full state for transmission."""
-        return {
-            "entries": {
-                ".".join(path): {"value": val, "timestamp": ts, "node_id": nid}
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full state for transmission.
+
+        Entries and tombstones are lists of records carrying the path as a
+        list of keys, so keys containing "." survive the round trip. The
+        operation log is only included when ``include_ops`` is true.
+        """
+        state: dict[str, Any] = {
+            "entries": [
+                {"path": list(path), "value": val, "timestamp": ts, "node_id": nid}
                 for path, (val, ts, nid) in self._entries.items()
-            },
-            "tombstones": {
-                ".".join(path): {"timestamp": ts, "node_id": nid}
+            ],
+            "tombstones": [
+                {"path": list(path), "timestamp": ts, "node_id": nid}
                 for path, (ts, nid) in self._tombstones.items()
-            },
-            "operations": [op.to_dict() for op in self._operations],
+            ],
         }
+        if include_ops:
+            state["operations"] = [op.to_tuple() for op in self._operations]
+        return state
+
+    def state_stream(self, include_ops: bool = False) -> Iterator[tuple[str, Any]]:
+        """
+        Yield ``("entry", (path, value, timestamp, node_id))`` and
+        ``("tombstone", (path, timestamp, node_id))`` items, then the
+        operations if requested.
+        """
+        for path, (val, ts, nid) in self._entries.items():
+            yield "entry", (path, val, ts, nid)
+        for path, (ts, nid) in self._tombstones.items():
+            yield "tombstone", (path, ts, nid)
+        if include_ops:
+            yield from self._stream_operations()
+
+    @staticmethod
+    def _state_records(records: Any) -> list[tuple[tuple[str, ...], dict[str, Any]]]:
+        """Normalize state records to (path, record) pairs.
+
+        Also accepts the older format keyed by dot-joined paths.
+        """
+        if isinstance(records, dict):
+            return [
+                (tuple(path_str.split(".")) if path_str else (), record)
+                for path_str, record in records.items()
+            ]
+        return [(tuple(record["path"]), record) for record in records]
 
     @classmethod
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "LWWMap":
         """Reconstruct map from transmitted state."""
         lww_map = cls(node_id)
 
-        for path_str, entry in state.get("entries", {}).items():
-            path = tuple(path_str.split(".")) if path_str else ()
+        for path, entry in cls._state_records(state.get("entries", ())):
+            if path not in lww_map._entries:
+                lww_map._index_path(path)
             lww_map._entries[path] = (
                 entry["value"],
                 entry["timestamp"],
                 entry["node_id"],
             )
 
-        for path_str, tombstone in state.get("tombstones", {}).items():
-            path = tuple(path_str.split(".")) if path_str else ()
+        for path, tombstone in cls._state_records(state.get("tombstones", ())):
             lww_map._tombstones[path] = (
                 tombstone["timestamp"],
                 tombstone["node_id"],
             )
 
-        lww_map._operations = [
-            Operation.from_dict(op) for op in state.get("operations", [])
-        ]
+        lww_map._load_operations(state.get("operations", ()))
 
         return lww_map
 
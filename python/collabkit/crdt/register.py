@@ -10,12 +10,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
+from .._compat import DATACLASS_SLOTS
 from .base import CRDT, Operation, StateCRDT
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TimestampedValue(Generic[T]):
     """A value with its associated timestamp and node ID."""
     value: T
@@ -48,11 +49,8 @@ class LWWRegister(StateCRDT[T]):
 
     def __init__(self, node_id: str, initial_value: T | None = None):
         super().__init__(node_id)
-        self._current: TimestampedValue[T | None] = TimestampedValue(
-            value=initial_value,
-            timestamp=0.0,
-            node_id=node_id,
-        )
+        # (timestamp, node_id, value) of the winning write
+        self._current: tuple[float, str, T | None] = (0.0, node_id, initial_value)
 
     def set(self, value: T) -> Operation:
         """
@@ -77,48 +75,68 @@ class LWWRegister(StateCRDT[T]):
         if op.op_type != "set":
             raise ValueError(f"LWWRegister only supports 'set' operations, got '{op.op_type}'")
 
-        new_value = TimestampedValue(
-            value=op.value,
-            timestamp=op.timestamp,
-            node_id=op.node_id,
-        )
-
         # Only update if new value is "greater" (later timestamp or higher node_id)
-        if new_value > self._current:
-            self._current = new_value
+        timestamp = op.timestamp
+        current_timestamp, current_node_id, _ = self._current
+        if timestamp > current_timestamp or (
+            timestamp == current_timestamp and op.node_id > current_node_id
+        ):
+            self._current = (timestamp, op.node_id, op.value)
 
         self._record_operation(op)
         return True
 
     def merge(self, other: "LWWRegister[T]") -> None:
         """Merge another register into this one."""
-        # Apply all operations from the other register
-        for op in other.all_operations():
-            self.apply(op)
+        new_ids = other._op_ids - self._op_ids
+        new_ops = [op for op in other._operations if op.id in new_ids] if new_ids else []
+
+        current = self._current
+        # The peer's winning write also competes, so replicas rebuilt with
+        # from_state() (no operation log) still merge. An unwritten peer only
+        # holds the (0.0, node_id, initial_value) placeholder; ignore that.
+        if other._operations or other._current[0] > 0.0:
+            timestamp, node_id, _ = other._current
+            if timestamp > current[0] or (timestamp == current[0] and node_id > current[1]):
+                current = other._current
+
+        # Validate everything before recording any
+        for op in new_ops:
+            if op.op_type != "set":
+                raise ValueError(f"LWWRegister only supports 'set' operations, got '{op.op_type}'")
+            if op.timestamp > current[0] or (
+                op.timestamp == current[0] and op.node_id > current[1]
+            ):
+                current = (op.timestamp, op.node_id, op.value)
+        self._current = current
+
+        for op in new_ops:
+            self._record_operation(op)
 
     def value(self) -> T | None:
         """Get the current value."""
-        return self._current.value
-
-    def state(self) -> dict[str, Any]:
-        """Get the full state for transmission."""
-        return {
-            "value": self._current.value,
-            "timestamp": self._current.timestamp,
-            "node_id": self._current.node_id,
-            "operations": [op.to_dict() for op in self._operations],
+        return self._current[2]
+
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full state for transmission.
+
+        The operation log is only included when ``include_ops`` is true.
+        """
+        timestamp, node_id, value = self._current
+        state: dict[str, Any] = {
+            "value": value,
+            "timestamp": timestamp,
+            "node_id": node_id,
         }
+        if include_ops:
+            state["operations"] = [op.to_tuple() for op in self._operations]
+        return state
 
     @classmethod
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "LWWRegister[T]":
         """Reconstruct register from transmitted state."""
         register = cls(node_id)
-        register._current = TimestampedValue(
-            value=state["value"],
-            timestamp=state["timestamp"],
-            node_id=state["node_id"],
-        )
-        register._operations = [
-            Operation.from_dict(op) for op in state.get("operations", [])
-        ]
+        register._current = (state["timestamp"], state["node_id"], state["value"])
+        register._load_operations(state.get("operations", ()))
         return register
@@ -7,7 +7,8 @@ is added and removed concurrently, the add wins (add-wins semantics).
 
 from __future__ import annotations
 
-from typing import Any, Generic, Set, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, Iterable, Set, TypeVar
 import hashlib
 import json
 
@@ -16,12 +17,34 @@ from .base import Operation, StateCRDT
 T = TypeVar("T")
 
 
+# Same output as json.dumps(value, sort_keys=True, default=str), without
+# building a new encoder on every call
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
+# Only exact scalar types are cached; containers such as (1,) and (True,)
+# compare equal but serialize differently
+_CACHEABLE_TYPES = frozenset({str, int, float, bool})
+
+
 def _hash_value(value: Any) -> str:
     """Create a deterministic hash for any JSON-serializable value."""
-    serialized = json.dumps(value, sort_keys=True, default=str)
+    if type(value) in _CACHEABLE_TYPES:
+        return _hash_scalar(value)
+    return _hash_serialized(value)
+
+
+def _hash_serialized(value: Any) -> str:
+    serialized = _HASH_ENCODER.encode(value)
     return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
 
+# typed=True keeps 1, 1.0 and True apart, which serialize differently
+@lru_cache(maxsize=4096, typed=True)
+def _hash_scalar(value: str | int | float | bool) -> str:
+    return _hash_serialized(value)
+
+
 class ORSet(StateCRDT[Set[T]]):
     """
     Observed-Remove Set (OR-Set / Add-Wins Set).
@@ -44,6 +67,11 @@ class ORSet(StateCRDT[Set[T]]):
         self._elements: dict[str, set[tuple[str, Any]]] = {}
         # Set of removed tags
         self._removed_tags: set[str] = set()
+        # Element hash -> one surviving value, for every element present
+        self._live: dict[str, Any] = {}
+        # Live tag -> hash of the element it was added under, so removes
+        # depend only on their tags, not on how the element re-hashes
+        self._tag_hashes: dict[str, str] = {}
 
     def add(self, value: T) -> Operation:
         """
@@ -101,77 +129,95 @@ class ORSet(StateCRDT[Set[T]]):
 
     def _apply_add(self, op: Operation) -> None:
         """Apply an add operation."""
-        value = op.value
-        value_hash = _hash_value(value)
-
         # Use operation ID as unique tag
         tag = op.id
 
+        # The remove for this tag was delivered first; nothing to keep
+        if tag in self._removed_tags:
+            return
+
+        value = op.value
+        value_hash = _hash_value(value)
+
         if value_hash not in self._elements:
             self._elements[value_hash] = set()
+            self._live[value_hash] = value
 
         self._elements[value_hash].add((tag, value))
+        self._tag_hashes[tag] = value_hash
 
     def _apply_remove(self, op: Operation) -> None:
         """Apply a remove operation."""
         tags = op.value.get("tags", [])
+        self._removed_tags.update(tags)
+
+        # Drop the now-dead (tag, value) pairs. The tags stay in
+        # _removed_tags so a late-arriving add for them stays removed.
+        if tags:
+            self._discard_tags(tags)
+
+    def _discard_tags(self, tags: Iterable[str]) -> None:
+        """Remove the pairs with the given tags, wherever they are stored."""
+        by_hash: dict[str, set[str]] = {}
         for tag in tags:
-            self._removed_tags.add(tag)
+            value_hash = self._tag_hashes.pop(tag, None)
+            if value_hash is not None:
+                by_hash.setdefault(value_hash, set()).add(tag)
+        for value_hash, hash_tags in by_hash.items():
+            self._discard_hash_tags(value_hash, hash_tags)
+
+    def _discard_hash_tags(self, value_hash: str, tags: set[str]) -> None:
+        """Remove pairs with the given tags from one element's tagged set."""
+        tagged_values = self._elements.get(value_hash)
+        if not tagged_values:
+            return
+        tagged_values.difference_update([pair for pair in tagged_values if pair[0] in tags])
+        if tagged_values:
+            # The removed pairs may have included the representative value
+            self._live[value_hash] = next(iter(tagged_values))[1]
+        else:
+            del self._elements[value_hash]
+            del self._live[value_hash]
 
     def merge(self, other: "ORSet[T]") -> None:
         """Merge another set into this one."""
-        # Merge elements
-        for value_hash, tagged_values in other._elements.items():
-            if value_hash not in self._elements:
-                self._elements[value_hash] = set()
-            self._elements[value_hash].update(tagged_values)
+        removed_tags = self._removed_tags
+        new_removed = other._removed_tags - removed_tags
 
         # Merge removed tags
-        self._removed_tags.update(other._removed_tags)
+        removed_tags.update(new_removed)
+
+        # Merge elements, skipping pairs either side has removed
+        for value_hash, tagged_values in other._elements.items():
+            live = [pair for pair in tagged_values if pair[0] not in removed_tags]
+            if live:
+                if value_hash not in self._elements:
+                    self._elements[value_hash] = set()
+                    self._live[value_hash] = live[0][1]
+                self._elements[value_hash].update(live)
+                for tag, _ in live:
+                    self._tag_hashes[tag] = value_hash
+
+        # Drop our own pairs that the other side has removed
+        if new_removed:
+            self._discard_tags(new_removed)
 
         # Merge operations
-        for op in other.all_operations():
-            if not self._has_seen(op):
-                self._record_operation(op)
+        self._merge_operations(other)
 
     def value(self) -> set[T]:
         """Get the current set contents."""
-        result = set()
-        for value_hash, tagged_values in self._elements.items():
-            for tag, val in tagged_values:
-                if tag not in self._removed_tags:
-                    # Can't add unhashable types to set, use first one found
-                    try:
-                        result.add(val)
-                    except TypeError:
-                        # Value is unhashable, skip duplicates
-                        if val not in [v for v in result]:
-                            result.add(val)
-                    break  # Only need one surviving instance
-        return result
+        # Values are stored inside (tag, value) set entries, so they are
+        # always hashable; use to_list() to keep equal-comparing values apart
+        return set(self._live.values())
 
     def to_list(self) -> list[T]:
         """Get the current set contents as a list (for unhashable types)."""
-        result = []
-        seen_hashes = set()
-        for value_hash, tagged_values in self._elements.items():
-            for tag, val in tagged_values:
-                if tag not in self._removed_tags and value_hash not in seen_hashes:
-                    result.append(val)
-                    seen_hashes.add(value_hash)
-                    break
-        return result
+        return list(self._live.values())
 
     def contains(self, value: T) -> bool:
         """Check if the set contains a value."""
-        value_hash = _hash_value(value)
-        if value_hash not in self._elements:
-            return False
-
-        for tag, _ in self._elements[value_hash]:
-            if tag not in self._removed_tags:
-                return True
-        return False
+        return _hash_value(value) in self._live
 
     def __contains__(self, value: T) -> bool:
         """Check if the set contains a value."""
@@ -179,30 +225,41 @@ class ORSet(StateCRDT[Set[T]]):
 
     def __len__(self) -> int:
         """Get the number of elements in the set."""
-        return len(self.to_list())
+        return len(self._live)
+
+    def state(self, include_ops: bool = False) -> dict[str, Any]:
+        """
+        Get the full state for transmission.
 
-    def state(self) -> dict[str, Any]:
-        """Get the full state for transmission."""
-        return {
+        The operation log is only included when ``include_ops`` is true.
+        """
+        state: dict[str, Any] = {
             "elements": {
                 vh: [(tag, val) for tag, val in tagged]
                 for vh, tagged in self._elements.items()
             },
             "removed_tags": list(self._removed_tags),
-            "operations": [op.to_dict() for op in self._operations],
         }
+        if include_ops:
+            state["operations"] = [op.to_tuple() for op in self._operations]
+        return state
 
     @classmethod
     def from_state(cls, node_id: str, state: dict[str, Any]) -> "ORSet[T]":
         """Reconstruct set from transmitted state."""
         or_set: ORSet[T] = cls(node_id)
 
-        for value_hash, tagged_list in state.get("elements", {}).items():
-            or_set._elements[value_hash] = {(tag, val) for tag, val in tagged_list}
+        removed_tags = or_set._removed_tags = set(state.get("removed_tags", []))
 
-        or_set._removed_tags = set(state.get("removed_tags", []))
-        or_set._operations = [
-            Operation.from_dict(op) for op in state.get("operations", [])
-        ]
+        # Older states may still carry removed pairs; keep only live ones
+        for value_hash, tagged_list in state.get("elements", {}).items():
+            live = {(tag, val) for tag, val in tagged_list if tag not in removed_tags}
+            if live:
+                or_set._elements[value_hash] = live
+                or_set._live[value_hash] = next(iter(live))[1]
+                for tag, _ in live:
+                    or_set._tag_hashes[tag] = value_hash
+
+        or_set._load_operations(state.get("operations", ()))
 
         return or_set
@@ -74,39 +74,49 @@ class PermissionManager:
     """Manages permissions for users and resources."""
 
     def __init__(self) -> None:
-        self._user_roles: dict[str, dict[str, Role]] = {}
+        self._user_roles: dict[tuple[str, str], Role] = {}
+        # user_id -> resource ids with a role, for list_user_resources
+        self._by_user: dict[str, set[str]] = {}
         self._resource_permissions: dict[str, dict[str, set[Permission]]] = {}
 
     def assign_role(self, user_id: str, resource_id: str, role: Role) -> None:
         """Assign a role to a user for a specific resource."""
-        if user_id not in self._user_roles:
-            self._user_roles[user_id] = {}
-        self._user_roles[user_id][resource_id] = role
+        self._user_roles[(user_id, resource_id)] = role
+        resources = self._by_user.get(user_id)
+        if resources is None:
+            resources = self._by_user[user_id] = set()
+        resources.add(resource_id)
 
     def get_role(self, user_id: str, resource_id: str) -> Role | None:
         """Get the role assigned to a user for a resource."""
-        return self._user_roles.get(user_id, {}).get(resource_id)
+        return self._user_roles.get((user_id, resource_id))
 
     def check_permission(
         self, user_id: str, resource_id: str, permission: Permission
     ) -> bool:
         """Check if a user has a specific permission on a resource."""
-        role = self.get_role(user_id, resource_id)
+        role = self._user_roles.get((user_id, resource_id))
         if role is None:
             return False
         return role.has_permission(permission)
 
     def revoke_access(self, user_id: str, resource_id: str) -> bool:
         """Revoke a user's access to a resource."""
-        if user_id in self._user_roles:
-            if resource_id in self._user_roles[user_id]:
-                del self._user_roles[user_id][resource_id]
-                return True
-        return False
+        if self._user_roles.pop((user_id, resource_id), None) is None:
+            return False
+        resources = self._by_user[user_id]
+        resources.discard(resource_id)
+        if not resources:
+            del self._by_user[user_id]
+        return True
 
     def list_user_resources(self, user_id: str) -> dict[str, Role]:
         """List all resources a user has access to."""
-        return self._user_roles.get(user_id, {}).copy()
+        user_roles = self._user_roles
+        return {
+            resource_id: user_roles[(user_id, resource_id)]
+            for resource_id in self._by_user.get(user_id, ())
+        }
 
 
 __all__ = [
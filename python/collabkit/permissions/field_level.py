@@ -6,13 +6,40 @@ Allows fine-grained access control on specific paths within documents.
 
 from __future__ import annotations
 
+import os
+import re
+import sys
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
 from typing import Any, Callable
 
 from .rbac import Permission
 from ..auth.base import AuthUser
 
+# Operation type -> permission it requires (anything else needs WRITE)
+_OP_PERMISSIONS: dict[str, Permission] = {
+    "set": Permission.WRITE,
+    "delete": Permission.DELETE,
+    "increment": Permission.WRITE,
+    "decrement": Permission.WRITE,
+    "add": Permission.WRITE,
+    "remove": Permission.WRITE,
+}
+
+_PLACEHOLDER = re.compile(r'\{[^}]+\}')
+# Segments with no glob or regex meaning, usable as an exact index key
+_LITERAL_SEGMENT = re.compile(r'[A-Za-z0-9_\-]+')
+
+
+def _literal_prefix(pattern: str) -> tuple[str, ...]:
+    """Leading segments of a pattern that can only match themselves."""
+    prefix = []
+    for segment in _PLACEHOLDER.sub('*', pattern).split("."):
+        if not _LITERAL_SEGMENT.fullmatch(segment):
+            break
+        prefix.append(segment)
+    return tuple(prefix)
+
 
 @dataclass
 class FieldRule:
@@ -29,9 +56,44 @@ class FieldRule:
     """
     path_pattern: str
     permission: Permission
-    allowed_roles: list[str] = field(default_factory=list)
-    denied_roles: list[str] = field(default_factory=list)
+    allowed_roles: frozenset[str] = field(default_factory=frozenset)
+    denied_roles: frozenset[str] = field(default_factory=frozenset)
     condition: Callable[[AuthUser, list[str]], bool] | None = None
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _normcase: bool = field(init=False, repr=False, compare=False)
+    # Fast paths for glob patterns: an exact string, or the text around a
+    # single "*" (which, as in fnmatch, may span several segments)
+    _literal: str | None = field(init=False, repr=False, compare=False)
+    _affixes: tuple[str, str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of role names (e.g. lists)
+        self.allowed_roles = frozenset(self.allowed_roles)
+        self.denied_roles = frozenset(self.denied_roles)
+
+        # Handle {placeholder} syntax - convert to *
+        pattern = _PLACEHOLDER.sub('*', self.path_pattern)
+        self._literal = None
+        self._affixes = None
+
+        # Handle ** for recursive matching
+        if "**" in pattern:
+            # Convert ** to a regex pattern
+            regex_pattern = pattern.replace(".", r"\.").replace("**", ".*").replace("*", "[^.]*")
+            self._regex = re.compile(f"^{regex_pattern}$")
+            self._normcase = False
+        else:
+            # Same matching as fnmatch.fnmatch, compiled once
+            pattern = os.path.normcase(pattern)
+            self._regex = re.compile(translate(pattern))
+            self._normcase = True
+            if "?" not in pattern and "[" not in pattern:
+                stars = pattern.count("*")
+                if stars == 0:
+                    self._literal = pattern
+                elif stars == 1:
+                    prefix, suffix = pattern.split("*")
+                    self._affixes = (prefix, suffix)
 
     def matches_path(self, path: list[str]) -> bool:
         """
@@ -44,19 +106,18 @@ class FieldRule:
         - Literal strings match exactly
         """
         path_str = ".".join(path)
-        pattern = self.path_pattern
-
-        # Handle {placeholder} syntax - convert to *
-        import re
-        pattern = re.sub(r'\{[^}]+\}', '*', pattern)
-
-        # Handle ** for recursive matching
-        if "**" in pattern:
-            # Convert ** to a regex pattern
-            regex_pattern = pattern.replace(".", r"\.").replace("**", ".*").replace("*", "[^.]*")
-            return bool(re.match(f"^{regex_pattern}$", path_str))
-
-        return fnmatch(path_str, pattern)
+        if self._normcase:
+            path_str = os.path.normcase(path_str)
+            if self._literal is not None:
+                return path_str == self._literal
+            if self._affixes is not None:
+                prefix, suffix = self._affixes
+                return (
+                    len(path_str) >= len(prefix) + len(suffix)
+                    and path_str.startswith(prefix)
+                    and path_str.endswith(suffix)
+                )
+        return self._regex.match(path_str) is not None
 
     def check(self, user: AuthUser, path: list[str]) -> bool | None:
         """
@@ -71,9 +132,8 @@ class FieldRule:
             return None
 
         # Check denied roles first
-        for role in user.roles:
-            if role in self.denied_roles:
-                return False
+        if self.denied_roles and not self.denied_roles.isdisjoint(user.roles):
+            return False
 
         # Check condition if present
         if self.condition is not None:
@@ -82,10 +142,7 @@ class FieldRule:
 
         # Check allowed roles
         if self.allowed_roles:
-            for role in user.roles:
-                if role in self.allowed_roles:
-                    return True
-            return False
+            return not self.allowed_roles.isdisjoint(user.roles)
 
         # No explicit allow/deny, rule matches but doesn't decide
         return None
@@ -122,6 +179,10 @@ class FieldPermissions:
 
     def __init__(self):
         self._rules: list[FieldRule] = []
+        # Literal leading segments of a pattern -> permission -> rules with
+        # that prefix. Rules starting with a wildcard live under ().
+        self._index: dict[tuple[str, ...], dict[Permission, list[FieldRule]]] = {}
+        self._max_prefix = 0
 
     def add_rule(
         self,
@@ -147,13 +208,32 @@ class FieldPermissions:
         rule = FieldRule(
             path_pattern=path_pattern,
             permission=permission,
-            allowed_roles=allowed_roles or [],
-            denied_roles=denied_roles or [],
+            allowed_roles=frozenset(sys.intern(role) for role in allowed_roles or ()),
+            denied_roles=frozenset(sys.intern(role) for role in denied_roles or ()),
             condition=condition,
         )
         self._rules.append(rule)
+        prefix = _literal_prefix(path_pattern)
+        self._index.setdefault(prefix, {}).setdefault(permission, []).append(rule)
+        self._max_prefix = max(self._max_prefix, len(prefix))
         return rule
 
+    def _candidates(self, path: list[str], permission: Permission) -> list[FieldRule]:
+        """Rules for ``permission`` whose literal prefix matches the start of ``path``."""
+        index = self._index
+        # Split the joined path so segments containing "." line up with
+        # how patterns are matched
+        segments = ".".join(path).split(".")
+        candidates: list[FieldRule] = []
+        for depth in range(min(len(segments), self._max_prefix) + 1):
+            by_permission = index.get(tuple(segments[:depth]))
+            if by_permission:
+                for rule_permission, rules in by_permission.items():
+                    # Only check rules for the requested permission
+                    if rule_permission & permission:
+                        candidates.extend(rules)
+        return candidates
+
     def check(
         self,
         user: AuthUser,
@@ -175,11 +255,7 @@ class FieldPermissions:
         """
         result = None
 
-        for rule in self._rules:
-            # Only check rules for the requested permission
-            if not (rule.permission & permission):
-                continue
-
+        for rule in self._candidates(path, permission):
             rule_result = rule.check(user, path)
             if rule_result is False:
                 # Explicit deny takes precedence
@@ -192,6 +268,8 @@ class FieldPermissions:
     def clear_rules(self) -> None:
         """Remove all field-level rules."""
         self._rules.clear()
+        self._index.clear()
+        self._max_prefix = 0
 
 
 class PermissionChecker:
@@ -278,14 +356,5 @@ class PermissionChecker:
         Returns:
             True if operation is allowed
         """
-        permission_map = {
-            "set": Permission.WRITE,
-            "delete": Permission.DELETE,
-            "increment": Permission.WRITE,
-            "decrement": Permission.WRITE,
-            "add": Permission.WRITE,
-            "remove": Permission.WRITE,
-        }
-
-        permission = permission_map.get(op_type, Permission.WRITE)
-        return self.check(user, list(path), permission)
+        permission = _OP_PERMISSIONS.get(op_type, Permission.WRITE)
+        return self.check(user, path if isinstance(path, list) else list(path), permission)
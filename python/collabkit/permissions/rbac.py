@@ -6,9 +6,10 @@ Defines roles with permissions and checks user access.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Flag, auto
-from typing import Any
+from typing import Any, ClassVar, Iterable
 
 
 class Permission(Flag):
@@ -27,30 +28,23 @@ class Permission(Flag):
     CALL = auto()      # Can call server functions
     PRESENCE = auto()  # Can see/update presence
 
-    # Convenience combinations
-    @classmethod
-    @property
-    def VIEWER(cls) -> "Permission":
-        """Read-only access with presence."""
-        return cls.READ | cls.PRESENCE
+    # Convenience combinations, assigned below the class body
+    VIEWER: ClassVar[Permission]
+    EDITOR: ClassVar[Permission]
+    MODERATOR: ClassVar[Permission]
+    OWNER: ClassVar[Permission]
 
-    @classmethod
-    @property
-    def EDITOR(cls) -> "Permission":
-        """Can read and write."""
-        return cls.READ | cls.WRITE | cls.CALL | cls.PRESENCE
 
-    @classmethod
-    @property
-    def MODERATOR(cls) -> "Permission":
-        """Can read, write, and delete."""
-        return cls.READ | cls.WRITE | cls.DELETE | cls.CALL | cls.PRESENCE
-
-    @classmethod
-    @property
-    def OWNER(cls) -> "Permission":
-        """Full access."""
-        return cls.READ | cls.WRITE | cls.DELETE | cls.ADMIN | cls.CALL | cls.PRESENCE
+# Computed once at import; Flag values are immutable, so these are shared
+# constants rather than properties rebuilt on every access.
+# Read-only access with presence.
+Permission.VIEWER = Permission.READ | Permission.PRESENCE
+# Can read and write.
+Permission.EDITOR = Permission.READ | Permission.WRITE | Permission.CALL | Permission.PRESENCE
+# Can read, write, and delete.
+Permission.MODERATOR = Permission.EDITOR | Permission.DELETE
+# Full access.
+Permission.OWNER = Permission.MODERATOR | Permission.ADMIN
 
 
 @dataclass
@@ -123,8 +117,13 @@ class RBACManager:
             ...
     """
 
+    # Distinct role sets to remember before the cache is reset
+    _COMBINED_CACHE_SIZE = 1024
+
     def __init__(self):
         self._roles: dict[str, Role] = dict(ROLES)
+        # frozenset of role names -> combined permissions
+        self._combined_cache: dict[frozenset[str], Permission] = {}
 
     def define_role(
         self,
@@ -135,6 +134,9 @@ class RBACManager:
         """
         Define a new role or update an existing one.
 
+        Change role permissions through this method rather than by
+        mutating a Role in place, so cached combinations are refreshed.
+
         Args:
             name: Role name (e.g., "editor", "viewer")
             permissions: Permission flags for this role
@@ -143,8 +145,10 @@ class RBACManager:
         Returns:
             The created/updated Role
         """
+        name = sys.intern(name)
         role = Role(name=name, permissions=permissions, description=description)
         self._roles[name] = role
+        self._combined_cache.clear()
         return role
 
     def get_role(self, name: str) -> Role | None:
@@ -178,7 +182,7 @@ class RBACManager:
         Returns:
             True if any role has the permission
         """
-        return any(self.check(name, permission) for name in role_names)
+        return bool(self.get_combined_permissions(role_names) & permission)
 
     def get_permissions(self, role_name: str) -> Permission:
         """
@@ -195,19 +199,27 @@ class RBACManager:
             return Permission.NONE
         return role.permissions
 
-    def get_combined_permissions(self, role_names: list[str]) -> Permission:
+    def get_combined_permissions(self, role_names: Iterable[str]) -> Permission:
         """
         Get combined permissions from multiple roles.
 
+        Results are cached per distinct set of role names.
+
         Args:
             role_names: List of role names
 
         Returns:
             Combined Permission flags from all roles
         """
-        combined = Permission.NONE
-        for name in role_names:
-            combined |= self.get_permissions(name)
+        key = frozenset(role_names)
+        combined = self._combined_cache.get(key)
+        if combined is None:
+            combined = Permission.NONE
+            for name in key:
+                combined |= self.get_permissions(name)
+            if len(self._combined_cache) >= self._COMBINED_CACHE_SIZE:
+                self._combined_cache.clear()
+            self._combined_cache[key] = combined
         return combined
 
     def list_roles(self) -> list[Role]:
@@ -8,32 +8,46 @@ Tracks connected users per room and their presence data
 from __future__ import annotations
 
 import asyncio
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Awaitable
+from types import MappingProxyType
+from typing import Any, Callable, Awaitable, Coroutine, Iterator, Mapping
 
+from ._compat import DATACLASS_SLOTS
 from .protocol import User, PresenceBroadcast
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PresenceData:
-    """Presence data for a single user in a room."""
+    """
+    Presence data for a single user in a room.
+
+    ``last_updated`` is a ``time.monotonic()`` reading, so stale detection
+    is unaffected by wall-clock adjustments. ``to_dict()`` converts it
+    back to a wall-clock timestamp.
+    """
 
     user: User
     data: dict[str, Any] = field(default_factory=dict)
-    last_updated: float = field(default_factory=time.time)
+    last_updated: float = field(default_factory=time.monotonic)
+    # user.model_dump(), taken once; users aren't modified after joining
+    _user_dict: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._user_dict = self.user.model_dump()
 
     def update(self, data: dict[str, Any]) -> None:
         """Update presence data."""
         self.data.update(data)
-        self.last_updated = time.time()
+        self.last_updated = time.monotonic()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
-            "user": self.user.model_dump(),
+            "user": self._user_dict,
             "data": self.data,
-            "last_updated": self.last_updated,
+            "last_updated": time.time() - (time.monotonic() - self.last_updated),
         }
 
 
@@ -48,13 +62,13 @@ class RoomPresence:
 
     def __init__(self, room_id: str):
         self.room_id = room_id
+        # Only mutated synchronously from the event loop, so no lock needed
         self._users: dict[str, PresenceData] = {}
-        self._lock = asyncio.Lock()
 
     @property
-    def users(self) -> dict[str, PresenceData]:
-        """Get all user presence data."""
-        return self._users.copy()
+    def users(self) -> Mapping[str, PresenceData]:
+        """Read-only live view of all user presence data."""
+        return MappingProxyType(self._users)
 
     @property
     def user_count(self) -> int:
@@ -66,7 +80,11 @@ class RoomPresence:
         """Get list of all users in the room."""
         return [pd.user for pd in self._users.values()]
 
-    async def add_user(self, user: User, initial_data: dict[str, Any] | None = None) -> None:
+    def iter_users(self) -> Iterator[User]:
+        """Iterate over the users in the room without building a list."""
+        return (pd.user for pd in self._users.values())
+
+    def add_user(self, user: User, initial_data: dict[str, Any] | None = None) -> None:
         """
         Add a user to the room presence.
 
@@ -74,13 +92,12 @@ class RoomPresence:
             user: The user to add.
             initial_data: Optional initial presence data.
         """
-        async with self._lock:
-            self._users[user.id] = PresenceData(
-                user=user,
-                data=initial_data or {},
-            )
+        self._users[user.id] = PresenceData(
+            user=user,
+            data=initial_data or {},
+        )
 
-    async def remove_user(self, user_id: str) -> User | None:
+    def remove_user(self, user_id: str) -> User | None:
         """
         Remove a user from the room presence.
 
@@ -90,11 +107,18 @@ class RoomPresence:
         Returns:
             The removed user, or None if not found.
         """
-        async with self._lock:
-            presence = self._users.pop(user_id, None)
-            return presence.user if presence else None
+        presence = self._users.pop(user_id, None)
+        return presence.user if presence else None
+
+    async def aadd_user(self, user: User, initial_data: dict[str, Any] | None = None) -> None:
+        """Awaitable form of add_user(), for code written when it was async."""
+        self.add_user(user, initial_data)
 
-    async def update_presence(self, user_id: str, data: dict[str, Any]) -> bool:
+    async def aremove_user(self, user_id: str) -> User | None:
+        """Awaitable form of remove_user(), for code written when it was async."""
+        return self.remove_user(user_id)
+
+    def update_presence(self, user_id: str, data: dict[str, Any]) -> bool:
         """
         Update a user's presence data.
 
@@ -105,11 +129,31 @@ class RoomPresence:
         Returns:
             True if the user was found and updated, False otherwise.
         """
-        async with self._lock:
-            if user_id in self._users:
-                self._users[user_id].update(data)
-                return True
+        presence = self._users.get(user_id)
+        if presence is None:
             return False
+        presence.update(data)
+        return True
+
+    async def aupdate_presence(self, user_id: str, data: dict[str, Any]) -> bool:
+        """Awaitable form of update_presence(), for code written when it was async."""
+        return self.update_presence(user_id, data)
+
+    def remove_stale(self, threshold: float) -> list[str]:
+        """
+        Remove every user whose presence was last updated before ``threshold``.
+
+        Args:
+            threshold: A ``time.monotonic()`` reading.
+
+        Returns:
+            The IDs of the removed users.
+        """
+        users = self._users
+        stale = [user_id for user_id, pd in users.items() if pd.last_updated < threshold]
+        for user_id in stale:
+            del users[user_id]
+        return stale
 
     def get_presence(self, user_id: str) -> PresenceData | None:
         """
@@ -169,30 +213,41 @@ class PresenceManager:
             cleanup_interval: Seconds between cleanup runs.
         """
         self._rooms: dict[str, RoomPresence] = {}
+        # user_id -> ids of the rooms that user is present in
+        self._user_rooms: dict[str, set[str]] = {}
         self._lock = asyncio.Lock()
         self._stale_timeout = stale_timeout
         self._cleanup_interval = cleanup_interval
         self._cleanup_task: asyncio.Task | None = None
+        # Strong references to running background tasks; the event loop
+        # only keeps weak ones, so untracked tasks can be collected mid-flight
+        self._background_tasks: set[asyncio.Task] = set()
         self._broadcast_callback: PresenceBroadcastCallback | None = None
 
     def set_broadcast_callback(self, callback: PresenceBroadcastCallback) -> None:
         """Set the callback for broadcasting presence updates."""
         self._broadcast_callback = callback
 
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run a coroutine in the background, keeping it referenced until done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def start(self) -> None:
         """Start the presence manager and cleanup task."""
         if self._cleanup_task is None:
-            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+            self._cleanup_task = self._spawn(self._cleanup_loop())
 
     async def stop(self) -> None:
-        """Stop the presence manager and cleanup task."""
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._cleanup_task = None
+        """Stop the presence manager, its cleanup task and any background tasks."""
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._cleanup_task = None
 
     async def _cleanup_loop(self) -> None:
         """Periodically clean up stale presence data."""
@@ -202,19 +257,12 @@ class PresenceManager:
 
     async def _cleanup_stale(self) -> None:
         """Remove stale presence entries."""
-        now = time.time()
-        stale_threshold = now - self._stale_timeout
+        stale_threshold = time.monotonic() - self._stale_timeout
 
         async with self._lock:
             for room_id, room in list(self._rooms.items()):
-                stale_users = [
-                    user_id
-                    for user_id, pd in room.users.items()
-                    if pd.last_updated < stale_threshold
-                ]
-
-                for user_id in stale_users:
-                    await room.remove_user(user_id)
+                for user_id in room.remove_stale(stale_threshold):
+                    self._forget_user_room(user_id, room_id)
 
                 # Remove empty rooms
                 if room.is_empty():
@@ -226,6 +274,14 @@ class PresenceManager:
             self._rooms[room_id] = RoomPresence(room_id)
         return self._rooms[room_id]
 
+    def _forget_user_room(self, user_id: str, room_id: str) -> None:
+        """Drop a room from a user's entry in the reverse index."""
+        rooms = self._user_rooms.get(user_id)
+        if rooms is not None:
+            rooms.discard(room_id)
+            if not rooms:
+                del self._user_rooms[user_id]
+
     async def join_room(
         self,
         room_id: str,
@@ -243,10 +299,16 @@ class PresenceManager:
         Returns:
             List of all users currently in the room.
         """
+        # Interned since it keys both the room table and the user index
+        room_id = sys.intern(room_id)
         async with self._lock:
             room = self._get_or_create_room(room_id)
 
-        await room.add_user(user, initial_data)
+        room.add_user(user, initial_data)
+        rooms = self._user_rooms.get(user.id)
+        if rooms is None:
+            rooms = self._user_rooms[user.id] = set()
+        rooms.add(room_id)
         return room.user_list
 
     async def leave_room(self, room_id: str, user_id: str) -> User | None:
@@ -265,7 +327,9 @@ class PresenceManager:
             if not room:
                 return None
 
-            user = await room.remove_user(user_id)
+            user = room.remove_user(user_id)
+            if user is not None:
+                self._forget_user_room(user_id, room_id)
 
             # Clean up empty rooms
             if room.is_empty():
@@ -296,14 +360,17 @@ class PresenceManager:
         if not room:
             return False
 
-        updated = await room.update_presence(user_id, data)
+        updated = room.update_presence(user_id, data)
 
         if updated and broadcast and self._broadcast_callback:
-            message = PresenceBroadcast(
+            # Built from already-validated input, so skip revalidation
+            message = PresenceBroadcast.model_construct(
                 room_id=room_id,
                 user_id=user_id,
                 data=data,
             )
+            # Sent with no lock held, so a slow subscriber can't stall
+            # presence updates for other users or rooms
             await self._broadcast_callback(room_id, message)
 
         return updated
@@ -321,6 +388,19 @@ class PresenceManager:
         room = self._rooms.get(room_id)
         return room.user_list if room else []
 
+    def iter_room_users(self, room_id: str) -> Iterator[User]:
+        """
+        Iterate over the users in a room without building a list.
+
+        Args:
+            room_id: The room ID.
+
+        Returns:
+            An iterator over the room's users (empty if the room is unknown).
+        """
+        room = self._rooms.get(room_id)
+        return room.iter_users() if room else iter(())
+
     def get_room_presence(self, room_id: str) -> dict[str, dict[str, Any]]:
         """
         Get all presence data for a room.
@@ -372,11 +452,7 @@ class PresenceManager:
         Returns:
             List of room IDs.
         """
-        return [
-            room_id
-            for room_id, room in self._rooms.items()
-            if room.has_user(user_id)
-        ]
+        return list(self._user_rooms.get(user_id, ()))
 
     @property
     def room_count(self) -> int:
@@ -386,7 +462,7 @@ class PresenceManager:
     @property
     def total_users(self) -> int:
         """Get the total number of users across all rooms."""
-        return sum(room.user_count for room in self._rooms.values())
+        return sum(len(room._users) for room in self._rooms.values())
 
 
 __all__ = [
@@ -7,9 +7,16 @@ for validation and serialization.
 
 from __future__ import annotations
 
+import re
+import sys
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, field_validator, ConfigDict
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install collabkit[speedups]
+    orjson = None
 
 # Maximum lengths for string fields to prevent DoS
 MAX_ID_LENGTH = 256
@@ -20,6 +27,17 @@ MAX_METADATA_DEPTH = 5  # Reduced from 10 to prevent deep recursion
 MAX_VALUE_SIZE = 1024 * 100  # 100KB max for individual values
 MAX_PRESENCE_DATA_SIZE = 1024 * 10  # 10KB max for presence data
 
+# Identifiers reused as dict keys across rooms, presence and connections;
+# interned on ingress so repeats share one object and compare by identity
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Keys rejected anywhere in client-supplied objects
+_DANGEROUS_KEYS = frozenset(
+    {"__proto__", "constructor", "prototype", "__class__", "__init__", "__new__", "__dict__"}
+)
+# Segments rejected in client-supplied paths
+_DANGEROUS_PATH_KEYS = frozenset({"__proto__", "constructor", "prototype", "__class__"})
+
 
 # =============================================================================
 # User Model
@@ -29,41 +47,113 @@ MAX_PRESENCE_DATA_SIZE = 1024 * 10  # 10KB max for presence data
 import json as _json
 
 
-def _estimate_size(v: Any) -> int:
-    """Estimate the serialized size of a value."""
-    try:
-        return len(_json.dumps(v))
-    except (TypeError, ValueError):
-        return 0
+def _dumps(data: Any) -> str:
+    """Encode a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; fall back to the stdlib
+    return _json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
 
-def _validate_no_prototype_pollution(
-    v: Any, field_name: str = "value", depth: int = 0, max_size: int = MAX_VALUE_SIZE
-) -> Any:
-    """Recursively validate that no prototype pollution keys exist and check size limits."""
-    if depth > MAX_METADATA_DEPTH:
-        raise ValueError(f"Maximum nesting depth ({MAX_METADATA_DEPTH}) exceeded in {field_name}")
+# Characters json.dumps escapes in an ASCII string
+_needs_json_escape = re.compile(r'["\\\x00-\x1f\x7f]').search
+
 
-    # Check size at top level only to avoid repeated serialization
-    if depth == 0 and max_size > 0:
-        size = _estimate_size(v)
-        if size > max_size:
-            raise ValueError(f"Value too large ({size} bytes, max {max_size}) in {field_name}")
+def _str_size(s: str) -> int:
+    """Length of a string once JSON-encoded."""
+    if s.isascii() and _needs_json_escape(s) is None:
+        return len(s) + 2
+    return len(_json.dumps(s))
 
-    DANGEROUS_KEYS = {"__proto__", "constructor", "prototype", "__class__", "__init__", "__new__", "__dict__"}
+
+class _Rejected(Exception):
+    """A validation failure; the path to it is collected on the way out."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+        # Innermost first, e.g. ["[0]", ".name"]
+        self.segments: list[str] = []
+
+
+def _walk_value(v: Any, depth: int, limit: float) -> int:
+    """
+    Validate the keys in ``v`` and return its approximate JSON size.
+
+    Stops early, returning the size so far, once that exceeds ``limit``.
+    Field names are only built when something is rejected.
+    """
+    if depth > MAX_METADATA_DEPTH:
+        raise _Rejected(f"Maximum nesting depth ({MAX_METADATA_DEPTH}) exceeded")
 
     if isinstance(v, dict):
-        for key in v.keys():
+        # Braces plus ", " between items
+        size = 2 * len(v) or 2
+        for key, item in v.items():
             if not isinstance(key, str):
-                raise ValueError(f"Non-string key not allowed in {field_name}")
-            if key in DANGEROUS_KEYS:
-                raise ValueError(f"Dangerous key '{key}' not allowed in {field_name}")
+                raise _Rejected("Non-string key not allowed")
+            if key in _DANGEROUS_KEYS:
+                raise _Rejected(f"Dangerous key '{key}' not allowed")
             if key.startswith("_"):
-                raise ValueError(f"Keys starting with underscore not allowed in {field_name}")
-            _validate_no_prototype_pollution(v[key], f"{field_name}.{key}", depth + 1, max_size=0)
-    elif isinstance(v, list):
+                raise _Rejected("Keys starting with underscore not allowed")
+            try:
+                size += _str_size(key) + 2 + _walk_value(item, depth + 1, limit - size)
+            except _Rejected as e:
+                e.segments.append(f".{key}")
+                raise
+            if size > limit:
+                return size
+        return size
+    if isinstance(v, list):
+        size = 2 * len(v) or 2
         for i, item in enumerate(v):
-            _validate_no_prototype_pollution(item, f"{field_name}[{i}]", depth + 1, max_size=0)
+            try:
+                size += _walk_value(item, depth + 1, limit - size)
+            except _Rejected as e:
+                e.segments.append(f"[{i}]")
+                raise
+            if size > limit:
+                return size
+        return size
+    if isinstance(v, str):
+        return _str_size(v)
+    if v is None or v is True:
+        return 4
+    if v is False:
+        return 5
+    if isinstance(v, int):
+        # Roughly the number of decimal digits, without converting
+        return v.bit_length() // 3 + 1
+    if isinstance(v, float):
+        return len(repr(v))
+    return 0
+
+
+def _validate_no_prototype_pollution(
+    v: Any, field_name: str = "value", depth: int = 0, max_size: int = MAX_VALUE_SIZE
+) -> Any:
+    """
+    Validate that no prototype pollution keys exist and check size limits.
+
+    Keys and size are checked in one pass; the size is an estimate of the
+    JSON-encoded length, so nothing is actually serialized.
+    """
+    if not isinstance(v, (dict, list)) and depth <= MAX_METADATA_DEPTH:
+        # Primitives have no keys to check, and only strings can be large
+        if max_size > 0 and isinstance(v, str) and _str_size(v) > max_size:
+            raise ValueError(f"Value too large (over {max_size} bytes) in {field_name}")
+        return v
+
+    limit = max_size if max_size > 0 else float("inf")
+    try:
+        size = _walk_value(v, depth, limit)
+    except _Rejected as e:
+        location = field_name + "".join(reversed(e.segments))
+        raise ValueError(f"{e.reason} in {location}") from None
+    if size > limit:
+        raise ValueError(f"Value too large (over {max_size} bytes) in {field_name}")
     return v
 
 
@@ -72,7 +162,7 @@ class User(BaseModel):
 
     model_config = ConfigDict(str_max_length=MAX_NAME_LENGTH)
 
-    id: str = Field(..., max_length=MAX_ID_LENGTH)
+    id: _InternedStr = Field(..., max_length=MAX_ID_LENGTH)
     name: str = Field(..., max_length=MAX_NAME_LENGTH)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -91,7 +181,7 @@ class JoinMessage(BaseModel):
     """Client requests to join a room."""
 
     type: Literal["join"] = "join"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     token: Optional[str] = Field(None, max_length=MAX_ID_LENGTH * 4)
     user_info: Optional[Dict[str, Any]] = None
 
@@ -107,14 +197,14 @@ class LeaveMessage(BaseModel):
     """Client requests to leave a room."""
 
     type: Literal["leave"] = "leave"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
 
 
 class OperationMessage(BaseModel):
     """Client sends a CRDT operation."""
 
     type: Literal["operation"] = "operation"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     operation: Dict[str, Any]
 
     @field_validator("operation")
@@ -124,9 +214,8 @@ class OperationMessage(BaseModel):
         if "path" in v:
             path = v["path"]
             if isinstance(path, list):
-                DANGEROUS_KEYS = {"__proto__", "constructor", "prototype", "__class__"}
                 for segment in path:
-                    if isinstance(segment, str) and segment in DANGEROUS_KEYS:
+                    if isinstance(segment, str) and segment in _DANGEROUS_PATH_KEYS:
                         raise ValueError(f"Dangerous path segment '{segment}' not allowed")
         return _validate_no_prototype_pollution(v, "operation")
 
@@ -135,7 +224,7 @@ class SyncRequestMessage(BaseModel):
     """Client requests state synchronization."""
 
     type: Literal["sync_request"] = "sync_request"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     since_timestamp: float = 0.0
     version_vector: Optional[Dict[str, float]] = None
 
@@ -144,9 +233,9 @@ class CallMessage(BaseModel):
     """Client calls a registered server function."""
 
     type: Literal["call"] = "call"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     call_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    function_name: str = Field(..., min_length=1, max_length=MAX_NAME_LENGTH, pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+    function_name: _InternedStr = Field(..., min_length=1, max_length=MAX_NAME_LENGTH, pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*$")
     args: List[Any] = Field(default_factory=list, max_length=MAX_ARGS_COUNT)
     kwargs: Dict[str, Any] = Field(default_factory=dict)
 
@@ -165,7 +254,7 @@ class PresenceMessage(BaseModel):
     """Client sends presence update."""
 
     type: Literal["presence"] = "presence"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     data: Dict[str, Any]
 
     @field_validator("data")
@@ -194,7 +283,7 @@ class StateUpdateMessage(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     type: Literal["state_update"] = "state_update"
-    room_id: str = Field(..., alias="roomId", min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., alias="roomId", min_length=1, max_length=MAX_ID_LENGTH)
     path: Optional[str] = Field(None, max_length=MAX_PATH_LENGTH)
     value: Any = None
 
@@ -202,9 +291,8 @@ class StateUpdateMessage(BaseModel):
     @classmethod
     def validate_path(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
-            DANGEROUS_KEYS = {"__proto__", "constructor", "prototype", "__class__"}
             for segment in v.split("."):
-                if segment in DANGEROUS_KEYS:
+                if segment in _DANGEROUS_PATH_KEYS:
                     raise ValueError(f"Dangerous path segment '{segment}' not allowed")
         return v
 
@@ -223,7 +311,7 @@ class ScreenShareStartMessage(BaseModel):
     """Client starts sharing screen in a room."""
 
     type: Literal["screenshare_start"] = "screenshare_start"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     share_name: Optional[str] = Field(None, max_length=MAX_NAME_LENGTH)
 
 
@@ -231,15 +319,15 @@ class ScreenShareStopMessage(BaseModel):
     """Client stops sharing screen."""
 
     type: Literal["screenshare_stop"] = "screenshare_stop"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
 
 
 class RtcOfferMessage(BaseModel):
     """Client sends WebRTC SDP offer to a specific user."""
 
     type: Literal["rtc_offer"] = "rtc_offer"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    target_user_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    target_user_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     sdp: str = Field(..., max_length=65536)
 
 
@@ -247,8 +335,8 @@ class RtcAnswerMessage(BaseModel):
     """Client sends WebRTC SDP answer to a specific user."""
 
     type: Literal["rtc_answer"] = "rtc_answer"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    target_user_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    target_user_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     sdp: str = Field(..., max_length=65536)
 
 
@@ -256,8 +344,8 @@ class RtcIceCandidateMessage(BaseModel):
     """Client sends ICE candidate to a specific user."""
 
     type: Literal["rtc_ice_candidate"] = "rtc_ice_candidate"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    target_user_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    target_user_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     candidate: str = Field(..., max_length=4096)
     sdp_mid: Optional[str] = Field(None, max_length=256)
     sdp_m_line_index: Optional[int] = None
@@ -267,21 +355,21 @@ class RemoteControlRequestMessage(BaseModel):
     """Client requests remote control of another user's screen."""
 
     type: Literal["remote_control_request"] = "remote_control_request"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    target_user_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    target_user_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
 
 
 class RemoteControlResponseMessage(BaseModel):
     """Client responds to a remote control request."""
 
     type: Literal["remote_control_response"] = "remote_control_response"
-    room_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
-    target_user_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    room_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    target_user_id: _InternedStr = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     granted: bool
 
 
-# Union of all client message types
-ClientMessage = Union[
+# Union of all client message types, tagged by their "type" field
+ClientMessage = Annotated[Union[
     JoinMessage,
     LeaveMessage,
     OperationMessage,
@@ -298,7 +386,7 @@ ClientMessage = Union[
     RtcIceCandidateMessage,
     RemoteControlRequestMessage,
     RemoteControlResponseMessage,
-]
+], Field(discriminator="type")]
 
 
 # =============================================================================
@@ -306,7 +394,13 @@ ClientMessage = Union[
 # =============================================================================
 
 
-class JoinedMessage(BaseModel):
+class _ServerModel(BaseModel):
+    """Base for messages the server builds; they are only read and serialized."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class JoinedMessage(_ServerModel):
     """Server confirms client joined a room."""
 
     type: Literal["joined"] = "joined"
@@ -316,7 +410,7 @@ class JoinedMessage(BaseModel):
     state: Dict[str, Any]
 
 
-class OperationBroadcast(BaseModel):
+class OperationBroadcast(_ServerModel):
     """Server broadcasts an operation to room members."""
 
     type: Literal["operation"] = "operation"
@@ -325,7 +419,7 @@ class OperationBroadcast(BaseModel):
     operation: Dict[str, Any]
 
 
-class SyncMessage(BaseModel):
+class SyncMessage(_ServerModel):
     """Server sends state sync data."""
 
     type: Literal["sync"] = "sync"
@@ -335,7 +429,7 @@ class SyncMessage(BaseModel):
     version_vector: Dict[str, float] = Field(default_factory=dict)
 
 
-class CallResultMessage(BaseModel):
+class CallResultMessage(_ServerModel):
     """Server sends result of a function call."""
 
     type: Literal["call_result"] = "call_result"
@@ -345,7 +439,7 @@ class CallResultMessage(BaseModel):
     error: Optional[str] = None
 
 
-class PresenceBroadcast(BaseModel):
+class PresenceBroadcast(_ServerModel):
     """Server broadcasts presence update to room members."""
 
     type: Literal["presence"] = "presence"
@@ -354,7 +448,7 @@ class PresenceBroadcast(BaseModel):
     data: Dict[str, Any]
 
 
-class UserJoinedMessage(BaseModel):
+class UserJoinedMessage(_ServerModel):
     """Server notifies that a user joined the room."""
 
     type: Literal["user_joined"] = "user_joined"
@@ -362,7 +456,7 @@ class UserJoinedMessage(BaseModel):
     user: User
 
 
-class UserLeftMessage(BaseModel):
+class UserLeftMessage(_ServerModel):
     """Server notifies that a user left the room."""
 
     type: Literal["user_left"] = "user_left"
@@ -370,7 +464,7 @@ class UserLeftMessage(BaseModel):
     user_id: str
 
 
-class ErrorMessage(BaseModel):
+class ErrorMessage(_ServerModel):
     """Server sends an error message."""
 
     type: Literal["error"] = "error"
@@ -379,7 +473,7 @@ class ErrorMessage(BaseModel):
     details: Optional[Dict[str, Any]] = None
 
 
-class PongMessage(BaseModel):
+class PongMessage(_ServerModel):
     """Server responds to ping."""
 
     type: Literal["pong"] = "pong"
@@ -391,7 +485,7 @@ class PongMessage(BaseModel):
 # =============================================================================
 
 
-class ScreenShareStartedBroadcast(BaseModel):
+class ScreenShareStartedBroadcast(_ServerModel):
     """Server broadcasts that a user started sharing."""
 
     type: Literal["screenshare_started"] = "screenshare_started"
@@ -400,7 +494,7 @@ class ScreenShareStartedBroadcast(BaseModel):
     share_name: Optional[str] = None
 
 
-class ScreenShareStoppedBroadcast(BaseModel):
+class ScreenShareStoppedBroadcast(_ServerModel):
     """Server broadcasts that a user stopped sharing."""
 
     type: Literal["screenshare_stopped"] = "screenshare_stopped"
@@ -408,8 +502,8 @@ class ScreenShareStoppedBroadcast(BaseModel):
     user_id: str
 
 
-# Union of all server message types
-ServerMessage = Union[
+# Union of all server message types, tagged by their "type" field
+ServerMessage = Annotated[Union[
     JoinedMessage,
     OperationBroadcast,
     SyncMessage,
@@ -421,7 +515,7 @@ ServerMessage = Union[
     PongMessage,
     ScreenShareStartedBroadcast,
     ScreenShareStoppedBroadcast,
-]
+], Field(discriminator="type")]
 
 
 # =============================================================================
@@ -448,38 +542,21 @@ class ErrorCode(str, Enum):
 # =============================================================================
 
 
+# Validators for the tagged unions; the "type" field selects the model
+# directly instead of trying each member
+_CLIENT_MESSAGE_ADAPTER: TypeAdapter[ClientMessage] = TypeAdapter(ClientMessage)
+_SERVER_MESSAGE_ADAPTER: TypeAdapter[ServerMessage] = TypeAdapter(ServerMessage)
+
+
 def parse_client_message(data: Dict[str, Any]) -> ClientMessage:
     """
     Parse a raw dictionary into a typed client message.
 
     Raises:
-        ValueError: If the message type is unknown or invalid.
+        ValueError: If the message type is unknown or invalid
+            (pydantic's ValidationError is a ValueError).
     """
-    msg_type = data.get("type")
-
-    type_map = {
-        "join": JoinMessage,
-        "leave": LeaveMessage,
-        "operation": OperationMessage,
-        "sync_request": SyncRequestMessage,
-        "call": CallMessage,
-        "presence": PresenceMessage,
-        "ping": PingMessage,
-        "auth": AuthMessage,
-        "state_update": StateUpdateMessage,
-        "screenshare_start": ScreenShareStartMessage,
-        "screenshare_stop": ScreenShareStopMessage,
-        "rtc_offer": RtcOfferMessage,
-        "rtc_answer": RtcAnswerMessage,
-        "rtc_ice_candidate": RtcIceCandidateMessage,
-        "remote_control_request": RemoteControlRequestMessage,
-        "remote_control_response": RemoteControlResponseMessage,
-    }
-
-    if msg_type not in type_map:
-        raise ValueError(f"Unknown message type: {msg_type}")
-
-    return type_map[msg_type](**data)
+    return _CLIENT_MESSAGE_ADAPTER.validate_python(data)
 
 
 def parse_server_message(data: Dict[str, Any]) -> ServerMessage:
@@ -487,26 +564,10 @@ def parse_server_message(data: Dict[str, Any]) -> ServerMessage:
     Parse a raw dictionary into a typed server message.
 
     Raises:
-        ValueError: If the message type is unknown or invalid.
+        ValueError: If the message type is unknown or invalid
+            (pydantic's ValidationError is a ValueError).
     """
-    msg_type = data.get("type")
-
-    type_map = {
-        "joined": JoinedMessage,
-        "operation": OperationBroadcast,
-        "sync": SyncMessage,
-        "call_result": CallResultMessage,
-        "presence": PresenceBroadcast,
-        "user_joined": UserJoinedMessage,
-        "user_left": UserLeftMessage,
-        "error": ErrorMessage,
-        "pong": PongMessage,
-    }
-
-    if msg_type not in type_map:
-        raise ValueError(f"Unknown message type: {msg_type}")
-
-    return type_map[msg_type](**data)
+    return _SERVER_MESSAGE_ADAPTER.validate_python(data)
 
 
 __all__ = [
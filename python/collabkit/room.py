@@ -8,24 +8,39 @@ for creating and managing multiple rooms.
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable
 import uuid
 
+from ._compat import DATACLASS_SLOTS
 from .crdt.base import Operation
 from .crdt.map import LWWMap
-from .protocol import User, OperationBroadcast
+from .protocol import User, OperationBroadcast, _dumps
 from .presence import PresenceManager
 
 logger = logging.getLogger(__name__)
 
+# Limits for coalesced sends (see Room's coalesce_sends). A frame holds at
+# most this many messages and characters, keeping it well under the
+# client's 1MB message limit.
+COALESCE_MAX_MESSAGES = 64
+COALESCE_MAX_CHARS = 256 * 1024
+# Messages queued for one connection before it is dropped as too slow
+OUTBOX_LIMIT = 1024
+# Sends started at once by a broadcast; larger rooms are sent to in
+# batches, yielding to the event loop in between
+BROADCAST_BATCH = 64
+
 
 # Type alias for server function signature
 ServerFunction = Callable[..., Awaitable[Any]]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RegisteredFunction:
     """A registered server function that can be called by clients."""
 
@@ -33,6 +48,39 @@ class RegisteredFunction:
     func: ServerFunction
     requires_auth: bool = True
     required_permissions: list[str] = field(default_factory=list)
+    debounce_ms: int = 0
+    # Whether func takes the _room / _user context kwargs, from its signature
+    wants_room: bool = field(init=False, repr=False, compare=False)
+    wants_user: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            params = inspect.signature(self.func).parameters
+        except (TypeError, ValueError):
+            # Can't tell, so pass both as before
+            self.wants_room = self.wants_user = True
+            return
+        var_kw = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+        self.wants_room = var_kw or "_room" in params
+        self.wants_user = var_kw or "_user" in params
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _Outbox:
+    """Queued outgoing payloads for one connection and the task sending them."""
+
+    websocket: Any
+    queue: asyncio.Queue[str]
+    task: asyncio.Task | None = None
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _DebouncedCall:
+    """A shared in-flight call, its debounce deadline and how many await it."""
+
+    deadline: float
+    future: asyncio.Future
+    waiters: int = 0
 
 
 class Room:
@@ -51,6 +99,7 @@ class Room:
         room_id: str,
         node_id: str | None = None,
         initial_state: dict[str, Any] | None = None,
+        coalesce_sends: bool = False,
     ):
         """
         Initialize a room.
@@ -59,6 +108,10 @@ class Room:
             room_id: Unique identifier for the room.
             node_id: Node ID for CRDT operations (defaults to room_id).
             initial_state: Optional initial state for the room.
+            coalesce_sends: Queue broadcasts per connection and send whatever
+                has piled up while the previous send was in flight as one
+                frame (a JSON array of messages). Clients must accept
+                array frames.
         """
         self.room_id = room_id
         self.node_id = node_id or f"server-{room_id}"
@@ -68,12 +121,21 @@ class Room:
 
         # Connected users: user_id -> (User, WebSocket)
         self._connections: dict[str, tuple[User, Any]] = {}
+        # Immutable (user_id, User, WebSocket) copy of _connections, rebuilt
+        # on join/leave so broadcasts and listings can read it without a lock
+        self._conn_snapshot: tuple[tuple[str, User, Any], ...] = ()
+        # id(websocket) -> user_id, so exclude_ws resolves to a user ID
+        self._ws_to_uid: dict[int, str] = {}
+
+        # Per-connection send queues, only used with coalesce_sends
+        self._coalesce_sends = coalesce_sends
+        self._outboxes: dict[str, _Outbox] = {}
 
         # Registered functions (local to this room)
         self._functions: dict[str, RegisteredFunction] = {}
 
-        # Lock for thread-safe operations
-        self._lock = asyncio.Lock()
+        # In-flight debounced calls: (name, user_id, args key) -> shared call
+        self._recent_calls: dict[tuple[str, str | None, str], _DebouncedCall] = {}
 
         # Metadata
         self._created_at: float = 0.0
@@ -86,23 +148,23 @@ class Room:
 
     @property
     def value(self) -> dict[str, Any]:
-        """Get the current state value."""
+        """Get the current state value (cached and shared, so treat it as read-only)."""
         return self._state.value()
 
     @property
     def users(self) -> list[User]:
         """Get list of connected users."""
-        return [user for user, _ in self._connections.values()]
+        return [user for _, user, _ in self._conn_snapshot]
 
     @property
     def user_count(self) -> int:
         """Get number of connected users."""
-        return len(self._connections)
+        return len(self._conn_snapshot)
 
     @property
     def is_empty(self) -> bool:
         """Check if room has no connected users."""
-        return len(self._connections) == 0
+        return not self._conn_snapshot
 
     @property
     def metadata(self) -> dict[str, Any]:
@@ -121,8 +183,19 @@ class Room:
             user: The user joining.
             websocket: The user's WebSocket connection.
         """
-        async with self._lock:
-            self._connections[user.id] = (user, websocket)
+        # No await between reading and updating the connection table, so
+        # this can't interleave with other joins, leaves or broadcasts
+        previous = self._connections.get(user.id)
+        if previous is not None:
+            self._ws_to_uid.pop(id(previous[1]), None)
+        self._connections[user.id] = (user, websocket)
+        self._ws_to_uid[id(websocket)] = user.id
+        self._refresh_snapshot()
+        if self._coalesce_sends:
+            self._close_outbox(user.id)
+            outbox = _Outbox(websocket, asyncio.Queue(OUTBOX_LIMIT))
+            outbox.task = asyncio.create_task(self._drain_outbox(user.id, outbox))
+            self._outboxes[user.id] = outbox
 
     async def remove_user(self, user_id: str) -> User | None:
         """
@@ -134,9 +207,19 @@ class Room:
         Returns:
             The removed user, or None if not found.
         """
-        async with self._lock:
-            connection = self._connections.pop(user_id, None)
-            return connection[0] if connection else None
+        connection = self._connections.pop(user_id, None)
+        if connection is not None:
+            self._ws_to_uid.pop(id(connection[1]), None)
+            self._refresh_snapshot()
+        self._close_outbox(user_id)
+        return connection[0] if connection else None
+
+    def _refresh_snapshot(self) -> None:
+        """Rebuild the connection snapshot after _connections changes."""
+        self._conn_snapshot = tuple(
+            (user_id, user, websocket)
+            for user_id, (user, websocket) in self._connections.items()
+        )
 
     def get_user(self, user_id: str) -> User | None:
         """Get a user by ID."""
@@ -180,9 +263,9 @@ class Room:
         """Get all operations."""
         return self._state.all_operations()
 
-    def get_state_dict(self) -> dict[str, Any]:
+    def get_state_dict(self, include_ops: bool = False) -> dict[str, Any]:
         """Get the full state as a serializable dictionary."""
-        return self._state.state()
+        return self._state.state(include_ops=include_ops)
 
     def register_function(
         self,
@@ -190,6 +273,7 @@ class Room:
         func: ServerFunction,
         requires_auth: bool = True,
         required_permissions: list[str] | None = None,
+        debounce_ms: int = 0,
     ) -> None:
         """
         Register a server function for this room.
@@ -199,12 +283,15 @@ class Room:
             func: The async function to execute.
             requires_auth: Whether authentication is required.
             required_permissions: List of required permissions.
+            debounce_ms: Window in which identical calls from the same user
+                share the first call's result instead of running again.
         """
         self._functions[name] = RegisteredFunction(
             name=name,
             func=func,
             requires_auth=requires_auth,
             required_permissions=required_permissions or [],
+            debounce_ms=debounce_ms,
         )
 
     def get_function(self, name: str) -> RegisteredFunction | None:
@@ -241,12 +328,59 @@ class Room:
         if not func_info:
             raise KeyError(f"Function '{name}' not registered")
 
-        # Inject context if function accepts it
-        kwargs["_room"] = self
-        kwargs["_user"] = user
+        if not func_info.debounce_ms:
+            return await self._invoke(func_info, args, kwargs, user)
+
+        key = (
+            name,
+            user.id if user else None,
+            json.dumps([args, kwargs], sort_keys=True, default=str),
+        )
+        now = time.monotonic()
+        recent = self._recent_calls.get(key)
+        if recent is None or now >= recent.deadline:
+            task = asyncio.ensure_future(self._invoke(func_info, args, kwargs, user))
+            recent = _DebouncedCall(now + func_info.debounce_ms / 1000, task)
+            self._recent_calls[key] = recent
+            asyncio.get_running_loop().call_later(
+                func_info.debounce_ms / 1000, self._expire_call, key, recent
+            )
+
+        # Shielded so one caller timing out does not cancel the call for the
+        # others; once every caller has given up, the call is cancelled too
+        recent.waiters += 1
+        try:
+            return await asyncio.shield(recent.future)
+        finally:
+            recent.waiters -= 1
+            if not recent.waiters and not recent.future.done():
+                recent.future.cancel()
+                self._expire_call(key, recent)
+
+    async def _invoke(
+        self,
+        func_info: RegisteredFunction,
+        args: list[Any],
+        kwargs: dict[str, Any],
+        user: User | None,
+    ) -> Any:
+        """Run a registered function with room and user context."""
+        # Inject context if function accepts it, into a copy so the
+        # caller's kwargs (also used as the debounce key) stay unchanged
+        if func_info.wants_room or func_info.wants_user:
+            kwargs = dict(kwargs)
+            if func_info.wants_room:
+                kwargs["_room"] = self
+            if func_info.wants_user:
+                kwargs["_user"] = user
 
         return await func_info.func(*args, **kwargs)
 
+    def _expire_call(self, key: tuple[str, str | None, str], entry: _DebouncedCall) -> None:
+        """Drop a debounced call once its window has passed."""
+        if self._recent_calls.get(key) is entry:
+            del self._recent_calls[key]
+
     async def broadcast(
         self,
         message: Any,
@@ -261,37 +395,127 @@ class Room:
             exclude_user: Optional user ID to exclude from broadcast.
             exclude_ws: Optional WebSocket to exclude from broadcast.
         """
-        if hasattr(message, "model_dump"):
-            data = message.model_dump()
+        if not self._conn_snapshot:
+            return
+
+        # Serialize once and send the same text to every recipient
+        if hasattr(message, "model_dump_json"):
+            payload = message.model_dump_json()
         elif hasattr(message, "to_dict"):
-            data = message.to_dict()
+            payload = _dumps(message.to_dict())
         else:
-            data = message
+            payload = _dumps(message)
+
+        await self.broadcast_raw(payload, exclude_user=exclude_user, exclude_ws=exclude_ws)
+
+    async def broadcast_raw(
+        self,
+        payload: str,
+        exclude_user: str | None = None,
+        exclude_ws: Any | None = None,
+    ) -> None:
+        """
+        Broadcast an already-serialized JSON message to all connected users.
+
+        Args:
+            payload: The JSON text to send.
+            exclude_user: Optional user ID to exclude from broadcast.
+            exclude_ws: Optional WebSocket to exclude from broadcast.
+        """
+        if not self._conn_snapshot:
+            return
+
+        # Compare user IDs only; a WebSocket not in the room excludes nobody
+        exclude_ws_user = (
+            self._ws_to_uid.get(id(exclude_ws)) if exclude_ws is not None else None
+        )
+        if exclude_user is None:
+            exclude_user, exclude_ws_user = exclude_ws_user, None
 
         failed_users: list[str] = []
 
-        async with self._lock:
-            tasks = []
-            user_ids = []
-            for user_id, (_, websocket) in self._connections.items():
-                if user_id != exclude_user and websocket != exclude_ws:
-                    tasks.append(self._send_to_websocket(websocket, data))
-                    user_ids.append(user_id)
-
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for user_id, result in zip(user_ids, results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"Failed to send to user {user_id}: {result}")
+        if self._coalesce_sends:
+            for user_id, _, websocket in self._conn_snapshot:
+                if user_id != exclude_user and user_id != exclude_ws_user:
+                    outbox = self._outboxes.get(user_id)
+                    if outbox is None:
+                        continue
+                    try:
+                        outbox.queue.put_nowait(payload)
+                    except asyncio.QueueFull:
+                        logger.warning(f"Dropping user {user_id}: send queue full")
+                        failed_users.append(user_id)
+            for user_id in failed_users:
+                await self.remove_user(user_id)
+            return
+
+        # Read from the immutable snapshot, so joins and leaves while we
+        # send don't change who this broadcast goes to
+        targets = [
+            (user_id, websocket)
+            for user_id, _, websocket in self._conn_snapshot
+            if user_id != exclude_user and user_id != exclude_ws_user
+        ]
+
+        for start in range(0, len(targets), BROADCAST_BATCH):
+            if start:
+                await asyncio.sleep(0)
+            batch = targets[start:start + BROADCAST_BATCH]
+            results = await asyncio.gather(
+                *(self._send_to_websocket(websocket, payload) for _, websocket in batch),
+                return_exceptions=True,
+            )
+            for (user_id, websocket), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to send to user {user_id}: {result}")
+                    # The user may have reconnected while we were sending
+                    connection = self._connections.get(user_id)
+                    if connection is not None and connection[1] is websocket:
                         failed_users.append(user_id)
 
-        # Clean up failed connections outside the lock
         for user_id in failed_users:
             await self.remove_user(user_id)
 
-    async def _send_to_websocket(self, websocket: Any, data: Any) -> None:
-        """Send data to a WebSocket connection."""
-        await websocket.send_json(data)
+    async def _send_to_websocket(self, websocket: Any, payload: str) -> None:
+        """Send an already-serialized JSON payload to a WebSocket connection."""
+        await websocket.send_text(payload)
+
+    async def _drain_outbox(self, user_id: str, outbox: _Outbox) -> None:
+        """Send a connection's queued payloads, batching any that pile up."""
+        queue = outbox.queue
+        try:
+            while True:
+                batch = [await queue.get()]
+                size = len(batch[0])
+                while len(batch) < COALESCE_MAX_MESSAGES and size < COALESCE_MAX_CHARS:
+                    try:
+                        payload = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    batch.append(payload)
+                    size += len(payload) + 1
+                # A lone message goes out as-is, so single frames are unchanged
+                frame = batch[0] if len(batch) == 1 else "[" + ",".join(batch) + "]"
+                await self._send_to_websocket(outbox.websocket, frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to user {user_id}: {e}")
+            if self._outboxes.get(user_id) is outbox:
+                # Detach first so remove_user doesn't cancel this task
+                del self._outboxes[user_id]
+                await self.remove_user(user_id)
+
+    def _close_outbox(self, user_id: str) -> None:
+        """Stop and discard a connection's send queue, if it has one."""
+        outbox = self._outboxes.pop(user_id, None)
+        if outbox is not None and outbox.task is not None:
+            outbox.task.cancel()
+
+    def close(self) -> None:
+        """Stop the room's background send tasks (used when it is deleted)."""
+        for user_id in list(self._outboxes):
+            self._close_outbox(user_id)
 
 
 class RoomManager:
@@ -308,15 +532,18 @@ class RoomManager:
     def __init__(
         self,
         presence_manager: PresenceManager | None = None,
+        coalesce_sends: bool = False,
     ):
         """
         Initialize the room manager.
 
         Args:
             presence_manager: Optional presence manager for tracking users.
+            coalesce_sends: Create rooms that batch queued broadcasts per
+                connection (see Room).
         """
         self._rooms: dict[str, Room] = {}
-        self._lock = asyncio.Lock()
+        self._coalesce_sends = coalesce_sends
         self._presence = presence_manager or PresenceManager()
 
         # Global registered functions (available in all rooms)
@@ -358,36 +585,46 @@ class RoomManager:
         Returns:
             The created room.
         """
-        room_id = room_id or str(uuid.uuid4())
+        room_id = room_id or uuid.uuid4().hex
 
-        async with self._lock:
-            if room_id in self._rooms:
-                return self._rooms[room_id]
+        # Nothing is awaited until the room is registered, so concurrent
+        # calls for the same ID can't both create it
+        if room_id in self._rooms:
+            return self._rooms[room_id]
 
-            room = Room(room_id, initial_state=initial_state)
+        room = Room(
+            room_id, initial_state=initial_state, coalesce_sends=self._coalesce_sends
+        )
 
-            # Copy global functions to room
-            for name, func_info in self._global_functions.items():
-                room.register_function(
-                    name,
-                    func_info.func,
-                    func_info.requires_auth,
-                    func_info.required_permissions,
-                )
+        # Copy global functions to room
+        for name, func_info in self._global_functions.items():
+            room.register_function(
+                name,
+                func_info.func,
+                func_info.requires_auth,
+                func_info.required_permissions,
+                func_info.debounce_ms,
+            )
 
-            if metadata:
-                for key, value in metadata.items():
-                    room.set_metadata(key, value)
+        if metadata:
+            for key, value in metadata.items():
+                room.set_metadata(key, value)
 
-            self._rooms[room_id] = room
+        self._rooms[room_id] = room
 
-        # Notify callbacks
-        for callback in self._on_room_created:
-            await callback(room)
+        # Notify callbacks concurrently; a failing one doesn't stop the others
+        if self._on_room_created:
+            results = await asyncio.gather(
+                *(callback(room) for callback in self._on_room_created),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Room created callback failed for {room_id}: {result}")
 
         return room
 
-    async def get_room(self, room_id: str) -> Room | None:
+    def get_room(self, room_id: str) -> Room | None:
         """
         Get a room by ID.
 
@@ -399,6 +636,10 @@ class RoomManager:
         """
         return self._rooms.get(room_id)
 
+    async def aget_room(self, room_id: str) -> Room | None:
+        """Awaitable form of get_room(), for code written when it was async."""
+        return self._rooms.get(room_id)
+
     async def get_or_create_room(
         self,
         room_id: str,
@@ -429,15 +670,20 @@ class RoomManager:
         Returns:
             True if the room was deleted, False if not found.
         """
-        async with self._lock:
-            if room_id not in self._rooms:
-                return False
-
-            del self._rooms[room_id]
+        room = self._rooms.pop(room_id, None)
+        if room is None:
+            return False
+        room.close()
 
-        # Notify callbacks
-        for callback in self._on_room_deleted:
-            await callback(room_id)
+        # Notify callbacks concurrently; a failing one doesn't stop the others
+        if self._on_room_deleted:
+            results = await asyncio.gather(
+                *(callback(room_id) for callback in self._on_room_deleted),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Room deleted callback failed for {room_id}: {result}")
 
         return True
 
@@ -451,6 +697,7 @@ class RoomManager:
         func: ServerFunction,
         requires_auth: bool = True,
         required_permissions: list[str] | None = None,
+        debounce_ms: int = 0,
     ) -> None:
         """
         Register a global server function (available in all rooms).
@@ -460,12 +707,15 @@ class RoomManager:
             func: The async function.
             requires_auth: Whether authentication is required.
             required_permissions: List of required permissions.
+            debounce_ms: Window in which identical calls from the same user
+                share the first call's result instead of running again.
         """
         self._global_functions[name] = RegisteredFunction(
             name=name,
             func=func,
             requires_auth=requires_auth,
             required_permissions=required_permissions or [],
+            debounce_ms=debounce_ms,
         )
 
         # Add to existing rooms
@@ -475,6 +725,7 @@ class RoomManager:
                 func,
                 requires_auth,
                 required_permissions or [],
+                debounce_ms,
             )
 
     def get_function(self, name: str) -> RegisteredFunction | None:
@@ -498,17 +749,18 @@ class RoomManager:
             exclude_sender: Whether to exclude the sender from the broadcast.
         """
         room = self._rooms.get(room_id)
-        if not room:
+        if not room or room.is_empty:
             return
 
-        message = OperationBroadcast(
+        # Built from an already-applied operation, so skip revalidation
+        message = OperationBroadcast.model_construct(
             room_id=room_id,
             user_id=sender_id,
             operation=operation.to_dict(),
         )
 
-        await room.broadcast(
-            message,
+        await room.broadcast_raw(
+            message.model_dump_json(),
             exclude_user=sender_id if exclude_sender else None,
         )
 
@@ -519,17 +771,16 @@ class RoomManager:
         Returns:
             Number of rooms removed.
         """
-        async with self._lock:
-            empty_rooms = [
-                room_id
-                for room_id, room in self._rooms.items()
-                if room.is_empty
-            ]
+        empty_rooms = [
+            room_id
+            for room_id, room in self._rooms.items()
+            if room.is_empty
+        ]
 
-            for room_id in empty_rooms:
-                del self._rooms[room_id]
+        for room_id in empty_rooms:
+            del self._rooms[room_id]
 
-            return len(empty_rooms)
+        return len(empty_rooms)
 
     def on_room_created(self, callback: Callable[[Room], Awaitable[None]]) -> None:
         """Register a callback for room creation events."""
@@ -17,9 +17,15 @@ from contextlib import asynccontextmanager
 from typing import Any, Callable, Awaitable, Dict, List, Optional, Set, Union
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.routing import APIRouter
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install collabkit[speedups]
+    orjson = None
+
 from .auth import AuthProvider, AuthUser
 from .crdt.base import Operation
 from .permissions import Permission, PermissionManager
@@ -46,6 +52,7 @@ from .protocol import (
     PongMessage,
     ErrorCode,
     parse_client_message,
+    _dumps,
     ScreenShareStartMessage,
     ScreenShareStopMessage,
     RtcOfferMessage,
@@ -56,7 +63,7 @@ from .protocol import (
     ScreenShareStartedBroadcast,
     ScreenShareStoppedBroadcast,
 )
-from .room import RoomManager, ServerFunction
+from .room import Room, RoomManager, ServerFunction
 from .storage import StorageBackend
 
 logger = logging.getLogger(__name__)
@@ -198,6 +205,26 @@ class CollabkitServer:
         # Track screen share state: room_id -> sharer_user_id
         self._screen_sharers: Dict[str, str] = {}
 
+        # Message type -> handler, built once rather than per message
+        self._message_handlers: Dict[str, Callable[[WebSocket, Any], Awaitable[None]]] = {
+            "join": self._handle_join,
+            "leave": self._handle_leave,
+            "operation": self._handle_operation,
+            "state_update": self._handle_state_update,
+            "sync_request": self._handle_sync_request,
+            "call": self._handle_call,
+            "presence": self._handle_presence,
+            "ping": self._handle_ping,
+            "auth": self._handle_auth,
+            "screenshare_start": self._handle_screenshare_start,
+            "screenshare_stop": self._handle_screenshare_stop,
+            "rtc_offer": self._handle_rtc_offer,
+            "rtc_answer": self._handle_rtc_answer,
+            "rtc_ice_candidate": self._handle_rtc_ice_candidate,
+            "remote_control_request": self._handle_remote_control_request,
+            "remote_control_response": self._handle_remote_control_response,
+        }
+
         self._presence.set_broadcast_callback(self._broadcast_presence)
         self._setup_routes()
 
@@ -205,7 +232,10 @@ class CollabkitServer:
     def app(self) -> FastAPI:
         """Get the FastAPI application with WebSocket routes configured."""
         if self._app is None:
-            self._app = FastAPI(lifespan=self._lifespan)
+            self._app = FastAPI(
+                lifespan=self._lifespan,
+                default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+            )
             self._app.include_router(self._router)
         return self._app
 
@@ -248,11 +278,17 @@ class CollabkitServer:
         name: Optional[str] = None,
         requires_auth: bool = True,
         required_permissions: Optional[List[str]] = None,
+        debounce_ms: int = 0,
     ) -> Callable[[ServerFunction], ServerFunction]:
-        """Decorator to register a server function."""
+        """
+        Decorator to register a server function.
+
+        Set ``debounce_ms`` for idempotent functions: identical calls from the
+        same user within that window share the first call's result.
+        """
         def decorator(func: ServerFunction) -> ServerFunction:
             self._rooms.register_function(
-                name or func.__name__, func, requires_auth, required_permissions
+                name or func.__name__, func, requires_auth, required_permissions, debounce_ms
             )
             return func
         return decorator
@@ -289,7 +325,7 @@ class CollabkitServer:
                 except asyncio.TimeoutError:
                     # Send a ping to check if the connection is still alive
                     try:
-                        await websocket.send_json({"type": "ping"})
+                        await websocket.send_text(_dumps({"type": "ping"}))
                     except Exception:
                         break
                     continue
@@ -324,26 +360,7 @@ class CollabkitServer:
             await self._send_error(websocket, ErrorCode.INVALID_MESSAGE, "Invalid message format.")
             return
 
-        handlers = {
-            "join": self._handle_join,
-            "leave": self._handle_leave,
-            "operation": self._handle_operation,
-            "state_update": self._handle_state_update,
-            "sync_request": self._handle_sync_request,
-            "call": self._handle_call,
-            "presence": self._handle_presence,
-            "ping": self._handle_ping,
-            "auth": self._handle_auth,
-            "screenshare_start": self._handle_screenshare_start,
-            "screenshare_stop": self._handle_screenshare_stop,
-            "rtc_offer": self._handle_rtc_offer,
-            "rtc_answer": self._handle_rtc_answer,
-            "rtc_ice_candidate": self._handle_rtc_ice_candidate,
-            "remote_control_request": self._handle_remote_control_request,
-            "remote_control_response": self._handle_remote_control_response,
-        }
-
-        handler = handlers.get(message.type)
+        handler = self._message_handlers.get(message.type)
         if handler:
             await handler(websocket, message)
         else:
@@ -404,7 +421,7 @@ class CollabkitServer:
                 return
 
         # Get or create room
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             if self._auto_create_rooms:
                 initial_state = None
@@ -427,7 +444,7 @@ class CollabkitServer:
         response = JoinedMessage(
             room_id=room_id, user_id=protocol_user.id, users=room.users, state=room.value
         )
-        await websocket.send_json(response.model_dump())
+        await websocket.send_text(_dumps(response.model_dump()))
 
         broadcast = UserJoinedMessage(room_id=room_id, user=protocol_user)
         await room.broadcast(broadcast, exclude_user=protocol_user.id)
@@ -446,22 +463,28 @@ class CollabkitServer:
 
     async def _leave_room(self, websocket: WebSocket, room_id: str, user_id: str) -> None:
         """Leave a room and broadcast the departure."""
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if room:
             await room.remove_user(user_id)
             await self._presence.leave_room(room_id, user_id)
             await room.broadcast(UserLeftMessage(room_id=room_id, user_id=user_id))
 
             if self._storage:
-                await self._storage.save(
-                    f"room:{room_id}",
-                    {"state": room.value, "operations": [op.to_dict() for op in room.get_all_operations()]},
-                )
+                await self._save_room(room_id, room)
 
         async with self._ws_lock:
             if websocket in self._ws_rooms:
                 self._ws_rooms[websocket].discard(room_id)
 
+    async def _save_room(self, room_id: str, room: Room) -> None:
+        """Persist a room's state and operation log to the storage backend."""
+        # Backends receive live Python objects; MemoryStorage keeps them as-is and
+        # only serializing backends (e.g. PostgresStorage) pay for JSON encoding.
+        await self._storage.save(
+            f"room:{room_id}",
+            {"state": room.value, "operations": [op.to_dict() for op in room.get_all_operations()]},
+        )
+
     async def _handle_operation(self, websocket: WebSocket, message: OperationMessage) -> None:
         """Handle CRDT operation."""
         room_id = message.room_id
@@ -478,7 +501,7 @@ class CollabkitServer:
             await self._send_error(websocket, ErrorCode.PERMISSION_DENIED, "Permission denied to write.")
             return
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             await self._send_error(websocket, ErrorCode.ROOM_NOT_FOUND, f"Room '{room_id}' not found.")
             return
@@ -488,10 +511,7 @@ class CollabkitServer:
             if room.apply_operation(operation):
                 await self._rooms.broadcast_operation(room_id, operation, user_id, exclude_sender=True)
                 if self._save_on_operation and self._storage:
-                    await self._storage.save(
-                        f"room:{room_id}",
-                        {"state": room.value, "operations": [op.to_dict() for op in room.get_all_operations()]},
-                    )
+                    await self._save_room(room_id, room)
         except Exception:
             logger.exception("Operation error")
             await self._send_error(websocket, ErrorCode.INVALID_OPERATION, "Invalid operation.")
@@ -512,7 +532,7 @@ class CollabkitServer:
             await self._send_error(websocket, ErrorCode.PERMISSION_DENIED, "Permission denied to write.")
             return
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             await self._send_error(websocket, ErrorCode.ROOM_NOT_FOUND, f"Room '{room_id}' not found.")
             return
@@ -524,10 +544,7 @@ class CollabkitServer:
         await room.broadcast(broadcast, exclude_ws=websocket)
 
         if self._storage:
-            await self._storage.save(
-                f"room:{room_id}",
-                {"state": room.value, "operations": [op.to_dict() for op in room.get_all_operations()]},
-            )
+            await self._save_room(room_id, room)
 
     async def _handle_sync_request(self, websocket: WebSocket, message: SyncRequestMessage) -> None:
         """Handle sync request."""
@@ -551,7 +568,7 @@ class CollabkitServer:
             await self._send_error(websocket, ErrorCode.PERMISSION_DENIED, "Must join room before requesting sync.")
             return
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             await self._send_error(websocket, ErrorCode.ROOM_NOT_FOUND, f"Room '{room_id}' not found.")
             return
@@ -561,9 +578,10 @@ class CollabkitServer:
             room_id=room_id,
             state=room.value,
             operations=[op.to_dict() for op in operations],
-            version_vector=room.state._version_vector.to_dict(),
+            # The model validates into its own dict, so pass a view instead of a copy
+            version_vector=room.state._version_vector.view(),
         )
-        await websocket.send_json(response.model_dump())
+        await websocket.send_text(_dumps(response.model_dump()))
 
     async def _handle_call(self, websocket: WebSocket, message: CallMessage) -> None:
         """Handle function call."""
@@ -575,39 +593,39 @@ class CollabkitServer:
 
         # Must be in room to call functions
         if room_id not in user_rooms:
-            await websocket.send_json(CallResultMessage(
+            await websocket.send_text(_dumps(CallResultMessage(
                 call_id=message.call_id, success=False, error="Must join room before calling functions."
-            ).model_dump())
+            ).model_dump()))
             return
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
-            await websocket.send_json(CallResultMessage(
+            await websocket.send_text(_dumps(CallResultMessage(
                 call_id=message.call_id, success=False, error=f"Room '{room_id}' not found."
-            ).model_dump())
+            ).model_dump()))
             return
 
         func_info = room.get_function(message.function_name)
         if not func_info:
-            await websocket.send_json(CallResultMessage(
+            await websocket.send_text(_dumps(CallResultMessage(
                 call_id=message.call_id, success=False, error=f"Function '{message.function_name}' not found."
-            ).model_dump())
+            ).model_dump()))
             return
 
         # Check auth requirement - requires authenticated user (AuthUser), not just any user
         if func_info.requires_auth and not isinstance(user, AuthUser):
-            await websocket.send_json(CallResultMessage(
+            await websocket.send_text(_dumps(CallResultMessage(
                 call_id=message.call_id, success=False, error="Authentication required."
-            ).model_dump())
+            ).model_dump()))
             return
 
         if func_info.required_permissions and self._permissions and user:
             user_id = self._get_user_id(user)
             for perm in func_info.required_permissions:
                 if not self._permissions.check_permission(user_id, room_id, Permission(perm)):
-                    await websocket.send_json(CallResultMessage(
+                    await websocket.send_text(_dumps(CallResultMessage(
                         call_id=message.call_id, success=False, error=f"Permission denied: {perm}"
-                    ).model_dump())
+                    ).model_dump()))
                     return
 
         try:
@@ -625,7 +643,8 @@ class CollabkitServer:
             logger.exception(f"Function call error: {message.function_name}")
             response = CallResultMessage(call_id=message.call_id, success=False, error="Function execution failed.")
 
-        await websocket.send_json(response.model_dump())
+        # Function results are arbitrary user data, often the largest payload per call
+        await websocket.send_text(_dumps(response.model_dump()))
 
     async def _handle_presence(self, websocket: WebSocket, message: PresenceMessage) -> None:
         """Handle presence update."""
@@ -645,7 +664,7 @@ class CollabkitServer:
 
     async def _handle_ping(self, websocket: WebSocket, message: PingMessage) -> None:
         """Handle ping message."""
-        await websocket.send_json(PongMessage(timestamp=time.time()).model_dump())
+        await websocket.send_text(_dumps(PongMessage(timestamp=time.time()).model_dump()))
 
     async def _handle_auth(self, websocket: WebSocket, message: AuthMessage) -> None:
         """Handle authentication message (preferred over URL token for security)."""
@@ -673,7 +692,7 @@ class CollabkitServer:
                 self._ws_users[websocket] = user
                 self._user_connections[user_id].add(websocket)
 
-            await websocket.send_json({"type": "authenticated", "user_id": user_id})
+            await websocket.send_text(_dumps({"type": "authenticated", "user_id": user_id}))
         else:
             self._auth_rate_limiter.record_failure(ws_id)
             await self._send_error(websocket, ErrorCode.AUTHENTICATION_FAILED, "Invalid authentication token.")
@@ -712,7 +731,7 @@ class CollabkitServer:
 
         self._screen_sharers[room_id] = user_id
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if room:
             broadcast = ScreenShareStartedBroadcast(
                 room_id=room_id,
@@ -740,7 +759,7 @@ class CollabkitServer:
 
         del self._screen_sharers[room_id]
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if room:
             broadcast = ScreenShareStoppedBroadcast(
                 room_id=room_id,
@@ -761,19 +780,19 @@ class CollabkitServer:
 
         user_id = self._get_user_id(user)
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             return
 
         target_ws = room.get_websocket(message.target_user_id)
         if target_ws:
             try:
-                await target_ws.send_json({
+                await target_ws.send_text(_dumps({
                     "type": "rtc_offer",
                     "room_id": room_id,
                     "from_user_id": user_id,
                     "sdp": message.sdp,
-                })
+                }))
             except Exception:
                 logger.debug(f"Failed to relay rtc_offer to {message.target_user_id}")
 
@@ -790,19 +809,19 @@ class CollabkitServer:
 
         user_id = self._get_user_id(user)
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             return
 
         target_ws = room.get_websocket(message.target_user_id)
         if target_ws:
             try:
-                await target_ws.send_json({
+                await target_ws.send_text(_dumps({
                     "type": "rtc_answer",
                     "room_id": room_id,
                     "from_user_id": user_id,
                     "sdp": message.sdp,
-                })
+                }))
             except Exception:
                 logger.debug(f"Failed to relay rtc_answer to {message.target_user_id}")
 
@@ -819,21 +838,21 @@ class CollabkitServer:
 
         user_id = self._get_user_id(user)
 
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             return
 
         target_ws = room.get_websocket(message.target_user_id)
         if target_ws:
             try:
-                await target_ws.send_json({
+                await target_ws.send_text(_dumps({
                     "type": "rtc_ice_candidate",
                     "room_id": room_id,
                     "from_user_id": user_id,
                     "candidate": message.candidate,
                     "sdp_mid": message.sdp_mid,
                     "sdp_m_line_index": message.sdp_m_line_index,
-                })
+                }))
             except Exception:
                 logger.debug(f"Failed to relay ice candidate to {message.target_user_id}")
 
@@ -849,18 +868,18 @@ class CollabkitServer:
             return
 
         user_id = self._get_user_id(user)
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             return
 
         target_ws = room.get_websocket(message.target_user_id)
         if target_ws:
             try:
-                await target_ws.send_json({
+                await target_ws.send_text(_dumps({
                     "type": "remote_control_request",
                     "room_id": room_id,
                     "from_user_id": user_id,
-                })
+                }))
             except Exception:
                 pass
 
@@ -876,25 +895,25 @@ class CollabkitServer:
             return
 
         user_id = self._get_user_id(user)
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if not room:
             return
 
         target_ws = room.get_websocket(message.target_user_id)
         if target_ws:
             try:
-                await target_ws.send_json({
+                await target_ws.send_text(_dumps({
                     "type": "remote_control_response",
                     "room_id": room_id,
                     "from_user_id": user_id,
                     "granted": message.granted,
-                })
+                }))
             except Exception:
                 pass
 
     async def _broadcast_presence(self, room_id: str, message: PresenceBroadcast) -> None:
         """Broadcast presence update to room."""
-        room = await self._rooms.get_room(room_id)
+        room = self._rooms.get_room(room_id)
         if room:
             await room.broadcast(message, exclude_user=message.user_id)
 
@@ -903,7 +922,7 @@ class CollabkitServer:
     ) -> None:
         """Send an error message to a WebSocket."""
         try:
-            await websocket.send_json(ErrorMessage(code=code.value, message=message, details=details).model_dump())
+            await websocket.send_text(_dumps(ErrorMessage(code=code.value, message=message, details=details).model_dump()))
         except Exception:
             logger.debug("Failed to send error message to WebSocket")
 
@@ -927,7 +946,7 @@ class CollabkitServer:
             # Clean up screen share state if this user was sharing
             if self._screen_sharers.get(room_id) == user_id:
                 del self._screen_sharers[room_id]
-                room = await self._rooms.get_room(room_id)
+                room = self._rooms.get_room(room_id)
                 if room:
                     await room.broadcast(
                         ScreenShareStoppedBroadcast(room_id=room_id, user_id=user_id)
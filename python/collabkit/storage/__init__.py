@@ -6,6 +6,7 @@ Provides storage backends for persisting collaborative data.
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -93,7 +94,17 @@ class MemoryStorage(StorageBackend):
 
 
 class PostgresStorage(StorageBackend):
-    """PostgreSQL storage backend for production use."""
+    """
+    PostgreSQL storage backend for production use.
+
+    Uses a native asyncpg connection pool. Queries are parameterized with
+    ``$n`` placeholders so asyncpg can prepare them once per connection and
+    reuse them from its statement cache.
+
+    One pool is created on connect() and shared by every room and request.
+    Pass ``pool`` to reuse a process-wide pool owned by the application
+    instead; it is then left open on disconnect().
+    """
 
     def __init__(
         self,
@@ -102,25 +113,48 @@ class PostgresStorage(StorageBackend):
         database: str = "collabkit",
         user: str = "postgres",
         password: str = "",
+        min_size: int = 2,
+        max_size: int = 10,
+        statement_cache_size: int = 1024,
+        dsn: Optional[str] = None,
+        pool: Any = None,
     ) -> None:
         self._host = host
         self._port = port
         self._database = database
         self._user = user
         self._password = password
+        self._min_size = min_size
+        self._max_size = max_size
+        self._statement_cache_size = statement_cache_size
+        self._dsn = dsn
+        self._shared_pool = pool
         self._pool: Any = None
 
     async def connect(self) -> None:
         """Establish connection to PostgreSQL."""
-        import asyncpg
-
-        self._pool = await asyncpg.create_pool(
-            host=self._host,
-            port=self._port,
-            database=self._database,
-            user=self._user,
-            password=self._password,
-        )
+        if self._shared_pool is not None:
+            self._pool = self._shared_pool
+        elif self._pool is None:
+            import asyncpg
+
+            if self._dsn:
+                connect_args: Dict[str, Any] = {"dsn": self._dsn}
+            else:
+                connect_args = {
+                    "host": self._host,
+                    "port": self._port,
+                    "database": self._database,
+                    "user": self._user,
+                    "password": self._password,
+                }
+            self._pool = await asyncpg.create_pool(
+                **connect_args,
+                min_size=self._min_size,
+                max_size=self._max_size,
+                statement_cache_size=self._statement_cache_size,
+            )
+
         # Create table if not exists
         async with self._pool.acquire() as conn:
             await conn.execute("""
@@ -134,14 +168,12 @@ class PostgresStorage(StorageBackend):
 
     async def disconnect(self) -> None:
         """Close connection to PostgreSQL."""
-        if self._pool:
+        if self._pool and self._pool is not self._shared_pool:
             await self._pool.close()
-            self._pool = None
+        self._pool = None
 
     async def save(self, key: str, data: Dict[str, Any]) -> bool:
         """Save data to PostgreSQL."""
-        import json
-
         if not self._pool:
             raise RuntimeError("Not connected to database")
 
@@ -159,8 +191,6 @@ class PostgresStorage(StorageBackend):
 
     async def load(self, key: str) -> Optional[Dict[str, Any]]:
         """Load data from PostgreSQL."""
-        import json
-
         if not self._pool:
             raise RuntimeError("Not connected to database")
 
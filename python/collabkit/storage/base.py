@@ -148,6 +148,20 @@ class StorageProvider(ABC):
         """
         ...
 
+    async def save_operations(self, room_id: str, ops: list[Operation]) -> None:
+        """
+        Save several operations to the log.
+
+        The default implementation saves them one at a time; providers
+        can override it with a bulk insert.
+
+        Args:
+            room_id: The room identifier
+            ops: The operations to save
+        """
+        for op in ops:
+            await self.save_operation(room_id, op)
+
     @abstractmethod
     async def get_operations(
         self,
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator
 
 from .base import StorageProvider, RoomData, PresenceData
 from ..crdt.base import Operation
@@ -61,6 +63,10 @@ class PostgresStorage(StorageProvider):
         self._min_connections = min_connections
         self._max_connections = max_connections
         self._pool: Any = None
+        # Connection of the batch() running in the current task, if any
+        self._batch_conn: ContextVar[Any] = ContextVar(
+            f"collabkit_pg_batch_{id(self)}", default=None
+        )
 
     async def connect(self) -> None:
         """Initialize connection pool and create tables."""
@@ -142,11 +148,46 @@ class PostgresStorage(StorageProvider):
         if self._pool is None:
             raise RuntimeError("Not connected to database. Call connect() first.")
 
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        """Use the current batch's connection, or acquire one from the pool."""
+        conn = self._batch_conn.get()
+        if conn is not None:
+            yield conn
+            return
+        async with self._pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Run several writes on one connection in a single transaction.
+
+        Nested batches join the outer one.
+
+        Example:
+            async with storage.batch():
+                await storage.save_room(room)
+                await storage.save_operations(room.id, ops)
+        """
+        if self._batch_conn.get() is not None:
+            yield
+            return
+
+        self._ensure_connected()
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                token = self._batch_conn.set(conn)
+                try:
+                    yield
+                finally:
+                    self._batch_conn.reset(token)
+
     # Room operations
 
     async def get_room(self, room_id: str) -> RoomData | None:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             row = await conn.fetchrow(
                 "SELECT * FROM collabkit_rooms WHERE id = $1",
                 room_id,
@@ -163,7 +204,7 @@ class PostgresStorage(StorageProvider):
 
     async def save_room(self, room: RoomData) -> None:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             await conn.execute(
                 """
                 INSERT INTO collabkit_rooms (id, state, metadata, created_at, updated_at)
@@ -182,7 +223,7 @@ class PostgresStorage(StorageProvider):
 
     async def delete_room(self, room_id: str) -> bool:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             result = await conn.execute(
                 "DELETE FROM collabkit_rooms WHERE id = $1",
                 room_id,
@@ -191,7 +232,7 @@ class PostgresStorage(StorageProvider):
 
     async def list_rooms(self, limit: int = 100, offset: int = 0) -> list[RoomData]:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             rows = await conn.fetch(
                 """
                 SELECT * FROM collabkit_rooms
@@ -216,7 +257,7 @@ class PostgresStorage(StorageProvider):
 
     async def save_operation(self, room_id: str, op: Operation) -> None:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             await conn.execute(
                 """
                 INSERT INTO collabkit_operations
@@ -234,6 +275,34 @@ class PostgresStorage(StorageProvider):
                 time.time(),
             )
 
+    async def save_operations(self, room_id: str, ops: list[Operation]) -> None:
+        self._ensure_connected()
+        if not ops:
+            return
+        now = time.time()
+        async with self._connection() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO collabkit_operations
+                (id, room_id, timestamp, node_id, path, op_type, value, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                ON CONFLICT (id) DO NOTHING
+                """,
+                [
+                    (
+                        op.id,
+                        room_id,
+                        op.timestamp,
+                        op.node_id,
+                        list(op.path),
+                        op.op_type,
+                        json.dumps(op.value) if op.value is not None else None,
+                        now,
+                    )
+                    for op in ops
+                ],
+            )
+
     async def get_operations(
         self,
         room_id: str,
@@ -241,7 +310,7 @@ class PostgresStorage(StorageProvider):
         limit: int = 1000,
     ) -> list[Operation]:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             rows = await conn.fetch(
                 """
                 SELECT * FROM collabkit_operations
@@ -267,7 +336,7 @@ class PostgresStorage(StorageProvider):
 
     async def prune_operations(self, room_id: str, before: float) -> int:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             result = await conn.execute(
                 """
                 DELETE FROM collabkit_operations
@@ -286,7 +355,7 @@ class PostgresStorage(StorageProvider):
 
     async def save_presence(self, presence: PresenceData) -> None:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             await conn.execute(
                 """
                 INSERT INTO collabkit_presence
@@ -305,7 +374,7 @@ class PostgresStorage(StorageProvider):
 
     async def get_presence(self, room_id: str) -> list[PresenceData]:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             rows = await conn.fetch(
                 "SELECT * FROM collabkit_presence WHERE room_id = $1",
                 room_id,
@@ -323,7 +392,7 @@ class PostgresStorage(StorageProvider):
 
     async def delete_presence(self, room_id: str, connection_id: str) -> bool:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             result = await conn.execute(
                 """
                 DELETE FROM collabkit_presence
@@ -336,7 +405,7 @@ class PostgresStorage(StorageProvider):
 
     async def cleanup_stale_presence(self, older_than: float) -> int:
         self._ensure_connected()
-        async with self._pool.acquire() as conn:
+        async with self._connection() as conn:
             result = await conn.execute(
                 "DELETE FROM collabkit_presence WHERE last_seen < $1",
                 older_than,
@@ -0,0 +1,46 @@
+"""Tests for the LWW-Map CRDT."""
+
+import pytest
+
+from collabkit.crdt.base import Operation
+from collabkit.crdt.map import LWWMap
+
+
+def test_merge_with_bad_operation_records_nothing():
+    lww_map = LWWMap("node-a")
+    peer = LWWMap("node-b")
+    peer.set(["title"], "hello")
+    # An unsupported operation logged after a valid one
+    peer._record_operation(
+        Operation.create(node_id="node-b", path=("count",), op_type="increment", value=1)
+    )
+
+    with pytest.raises(ValueError):
+        lww_map.merge(peer)
+    assert lww_map.all_operations() == []
+    assert lww_map.value() == {}
+
+    # Once the peer's log is fixed, a retried merge still applies the set
+    peer._operations = [op for op in peer._operations if op.op_type == "set"]
+    peer._op_ids = {op.id for op in peer._operations}
+    lww_map.merge(peer)
+    assert lww_map.value() == {"title": "hello"}
+
+
+def test_merge_replica_rebuilt_from_state():
+    # state() leaves the operation log out by default, so the merge has to
+    # join the peer's entries and tombstones
+    source = LWWMap("node-a")
+    source.set(["user", "name"], "Alice")
+    source.set(["user", "age"], 30)
+    source.set(["draft"], "x")
+    source.delete(["draft"])
+
+    replica = LWWMap("node-b")
+    replica.merge(LWWMap.from_state("node-c", source.state()))
+    assert replica.value() == source.value() == {"user": {"name": "Alice", "age": 30}}
+
+    # A later local write still wins over the merged entry
+    replica.set(["user", "name"], "Bob")
+    replica.merge(LWWMap.from_state("node-c", source.state()))
+    assert replica.get(["user", "name"]) == "Bob"
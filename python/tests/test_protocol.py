@@ -0,0 +1,20 @@
+"""Tests for protocol message validation."""
+
+import json
+
+import pytest
+
+from collabkit.protocol import _validate_no_prototype_pollution
+
+
+@pytest.mark.parametrize("value", ['"' * 600, {"text": "\\" * 600}, ["\x01" * 200]])
+def test_size_limit_counts_json_escapes(value):
+    # Each character here takes 2-6 bytes once JSON-encoded
+    assert len(json.dumps(value)) > 1000
+    with pytest.raises(ValueError, match="too large"):
+        _validate_no_prototype_pollution(value, max_size=1000)
+
+
+def test_size_limit_allows_plain_ascii():
+    value = {"text": "a" * 900}
+    assert _validate_no_prototype_pollution(value, max_size=1000) is value
@@ -0,0 +1,35 @@
+"""Tests for the OR-Set CRDT."""
+
+from collabkit.crdt.base import Operation
+from collabkit.crdt.set import ORSet
+
+
+def test_remove_matches_by_tag_not_element_encoding():
+    or_set = ORSet("node-a")
+    add = or_set.add(1.0)
+
+    # A peer's remove whose element re-encodes differently (1.0 -> 1, as
+    # JSON.stringify does) must still remove the tagged pair
+    remove = Operation.create(
+        node_id="node-b",
+        path=(),
+        op_type="remove",
+        value={"element": 1, "tags": [add.id]},
+    )
+    assert or_set.apply(remove)
+
+    assert not or_set.contains(1.0)
+    assert len(or_set) == 0
+    assert or_set.value() == set()
+
+
+def test_merge_applies_peer_removes_by_tag():
+    or_set = ORSet("node-a")
+    or_set.add("apple")
+    peer = ORSet("node-b")
+    peer.merge(or_set)
+    peer.remove("apple")
+
+    or_set.merge(peer)
+    assert "apple" not in or_set
+    assert len(or_set) == 0